@@ -6,10 +6,10 @@
   │     ↓
   ├─ run_integrity_checks (Python 10종 검증)
   │     ↓
-  ├─ evaluate_results (Branch)
-  │     ├─ [CRITICAL] → alert_critical → escalate_to_oncall
-  │     ├─ [WARNING]  → alert_warning
-  │     └─ [PASS]     → log_success
+  ├─ notify (severity별 알림 디스패치)
+  │     ├─ [CRITICAL] → Slack 알림 + 온콜 에스컬레이션 판단
+  │     ├─ [WARNING]  → Slack 경고
+  │     └─ [PASS]     → 통과 로그
   │     ↓
   └─ generate_report (CSV/JSON/HTML)
        ↓
@@ -26,47 +26,49 @@ import json
 import os
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Dict
 
 from airflow import DAG
+from airflow.decorators import task
 from airflow.models import Variable
-from airflow.operators.python import BranchPythonOperator, PythonOperator
 from airflow.providers.postgres.operators.postgres import PostgresOperator
+from airflow.utils.task_group import TaskGroup
 from airflow.utils.trigger_rule import TriggerRule
 
+# C 구현 JSON 인코더 우선 사용 — 미설치 시 stdlib json으로 동작
 try:
-    from airflow.utils.task_group import TaskGroup
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        ).decode("utf-8")
 except ImportError:
-    TaskGroup = None  # Airflow < 2.3 fallback
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str, ensure_ascii=False, indent=2)
 
 # ── 프로젝트 경로 설정 ──
 PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_DIR)
 
-# ── YAML 설정 로드 (Airflow Variable 우선) ──
-try:
-    import yaml
-
-    _config_path = os.path.join(PROJECT_DIR, "config", "thresholds.yaml")
-    with open(_config_path, "r", encoding="utf-8") as _f:
-        DAG_CONFIG = yaml.safe_load(_f)
-
-    # 스키마 사전 검증 — DAG 파싱 단계에서 설정 오류 조기 탐지
-    from scripts.run_integrity_checks import validate_config_schema
-
-    _schema_errors = validate_config_schema(DAG_CONFIG) if DAG_CONFIG else ["빈 설정 파일"]
-    if _schema_errors:
-        import logging as _logging
+# ── YAML 설정 로드 ──
+# DAG 파싱 비용 최소화: yaml은 함수 안에서만 import하고 프로세스당 1회 캐시.
+# 스키마 검증은 파싱 단계가 아니라 run_checks 실행 시 load_config 내부에서 수행
+# (파싱 루프가 scripts.run_integrity_checks → numpy까지 끌어오지 않도록).
+@lru_cache(maxsize=1)
+def _load_dag_config() -> Dict[str, Any]:
+    try:
+        import yaml
 
-        _dag_logger = _logging.getLogger("metrics_quality_dag")
-        for _err in _schema_errors:
-            _dag_logger.warning("DAG 설정 스키마 검증 경고: %s", _err)
+        _config_path = os.path.join(PROJECT_DIR, "config", "thresholds.yaml")
+        with open(_config_path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except Exception:
+        return {}
 
-    if not DAG_CONFIG:
-        DAG_CONFIG = {}
-except Exception:
-    DAG_CONFIG = {}
 
+DAG_CONFIG = _load_dag_config()
 _airflow_cfg = DAG_CONFIG.get("airflow", {})
 
 
@@ -108,6 +110,20 @@ dag = DAG(
 POSTGRES_CONN_ID = _airflow_cfg.get("postgres_conn_id", "metrics_db")
 
 
+@lru_cache(maxsize=1)
+def _metrics_engine():
+    """메트릭 DB SQLAlchemy 엔진 — 워커 프로세스당 1회 생성 (QueuePool 재사용)
+
+    fork된 워커에서 첫 사용 시점에 lazy 생성되므로 pickle 문제가 없고,
+    같은 태스크 안의 병렬 쿼리들이 커넥션 풀을 공유합니다.
+    """
+    from airflow.providers.postgres.hooks.postgres import PostgresHook
+    from sqlalchemy import create_engine
+
+    hook = PostgresHook(postgres_conn_id=POSTGRES_CONN_ID)
+    return create_engine(hook.get_uri(), pool_pre_ping=True, pool_size=6, max_overflow=0)
+
+
 # ══════════════════════════════════════════════════════════
 # 콜백 함수
 # ══════════════════════════════════════════════════════════
@@ -129,26 +145,76 @@ def _on_task_failure(context: Dict[str, Any]) -> None:
     _send_slack_notification(message, severity="CRITICAL")
 
 
-def _send_slack_notification(message: str, severity: str = "INFO") -> None:
-    """Slack Webhook 알림"""
-    webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
+# 채널은 설정 트리를 호출마다 3단계 탐색하지 않도록 모듈 상수로 확정
+_SLACK_CHANNEL = DAG_CONFIG.get("alerting", {}).get("slack", {}).get("channel", "#data-quality-alerts")
+
+
+@lru_cache(maxsize=1)
+def _get_slack_webhook() -> str | None:
+    """Webhook URL 1회 확정 — 환경변수 우선, 없으면 Airflow Variable (프로세스당 조회 1회)"""
+    url = os.environ.get("SLACK_WEBHOOK_URL")
+    if url:
+        return url
+    try:
+        return Variable.get("slack_webhook_url", default_var=None)
+    except Exception:
+        return None
+
+
+# Webhook 호출마다 TCP+TLS 핸드셰이크를 반복하지 않도록 워커 프로세스당
+# 하나의 keep-alive Session을 재사용 (lazy 초기화 — DAG 파싱 시 requests 미로드)
+_SLACK_SESSION = None
+
+
+def _get_slack_session():
+    global _SLACK_SESSION
+    if _SLACK_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            # urllib3 기본 allowed_methods에는 POST가 없어 명시해야 상태 기반
+            # 재시도가 동작함 — 웹훅 전송은 사실상 멱등이라 재시도 안전
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503],
+                allowed_methods=frozenset({"POST"}),
+            ),
+        ))
+        _SLACK_SESSION = session
+    return _SLACK_SESSION
+
+
+def _send_slack_notification(
+    message: str,
+    severity: str = "INFO",
+    extra_attachments: list | None = None,
+) -> None:
+    """Slack Webhook 알림 — 한 번의 POST로 여러 attachment 블록 전송 가능"""
+    webhook_url = _get_slack_webhook()
     if not webhook_url:
         print(f"[Slack 알림 - {severity}] (webhook 미설정)\n{message}")
         return
 
     try:
-        import requests
-
         color_map = {"CRITICAL": "#dc2626", "WARNING": "#d97706", "INFO": "#2563eb", "PASS": "#10b981"}
+        attachments = [{
+            "color": color_map.get(severity, "#6b7280"),
+            "text": message,
+            "footer": f"metrics-quality-dashboard | {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        }]
+        if extra_attachments:
+            attachments.extend(extra_attachments)
         payload = {
-            "channel": DAG_CONFIG.get("alerting", {}).get("slack", {}).get("channel", "#data-quality-alerts"),
-            "attachments": [{
-                "color": color_map.get(severity, "#6b7280"),
-                "text": message,
-                "footer": f"metrics-quality-dashboard | {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            }],
+            "channel": _SLACK_CHANNEL,
+            "attachments": attachments,
         }
-        requests.post(webhook_url, json=payload, timeout=10)
+        _get_slack_session().post(webhook_url, json=payload, timeout=10)
     except Exception as e:
         print(f"Slack 알림 전송 실패: {e}")
 
@@ -185,100 +251,110 @@ def _on_task_retry(context: Dict[str, Any]) -> None:
 
 
 # ══════════════════════════════════════════════════════════
-# Task 함수
+# Task 함수 (TaskFlow)
 # ══════════════════════════════════════════════════════════
+# XCom 전략: run_checks가 summary 딕셔너리 하나를 반환하고,
+# 하류 태스크는 TaskFlow 인자로 전달받음 — 키별 xcom_pull 5회 → 조회 1회
 
-def run_integrity_checks_task(**context) -> str:
-    """10종 정합성 검증 실행
+@task(task_id="run_checks", retries=3, retry_delay=timedelta(minutes=2))
+def run_integrity_checks_task() -> Dict[str, Any]:
+    """10종 정합성 검증 실행 — 결과 summary 딕셔너리 반환
 
     재처리 전략:
       - 자동 재시도 시 동일 로직 재실행 (멱등성 보장)
       - dag_run.conf.force_alert_level 설정 시 강제 분기 가능
     """
-    from scripts.run_integrity_checks import MetricsIntegrityChecker, load_config
+    import numpy as np
+
+    from scripts.run_integrity_checks import ColumnBatch, MetricsIntegrityChecker, load_config
 
     config_path = os.path.join(PROJECT_DIR, "config", "thresholds.yaml")
     config = load_config(config_path)
     checker = MetricsIntegrityChecker(config=config)
 
     # ── DB에서 데이터 로드 ──
-    from airflow.providers.postgres.hooks.postgres import PostgresHook
-
-    hook = PostgresHook(postgres_conn_id=POSTGRES_CONN_ID)
-
-    def _query(sql: str):
-        conn = hook.get_conn()
-        cursor = conn.cursor()
-        cursor.execute(sql)
-        columns = [desc[0] for desc in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
-
-    usage_data = _query("SELECT year_month, card_company, usage_amount FROM credit_card_usage")
-    share_data = _query("SELECT year_month, card_company, market_share_pct, share_change_pp FROM kpi_market_share")
-    growth_data = _query(
-        "SELECT year_month, card_company, current_amount, prev_month_amount, "
-        "prev_year_amount, mom_growth_rate, yoy_growth_rate FROM kpi_growth_rate"
-    )
-    activation_data = _query("SELECT year_month, card_company, activation_rate FROM kpi_activation_rate")
-    monthly_data = _query("SELECT year_month, card_company, total_usage_amount FROM kpi_monthly_usage")
-    category_data = _query(
-        "SELECT year_month, card_company, business_category, category_share_pct FROM kpi_category_usage"
-    )
-
-    # ── 10종 검증 실행 ──
-    checker.check_sum_integrity(usage_data)
-    checker.check_market_share_integrity(share_data)
-    checker.check_category_ratio_integrity(category_data)
-    checker.check_formula_mom(growth_data)
-    checker.check_formula_yoy(growth_data)
-    checker.check_range_activation(activation_data)
-    checker.check_continuity(monthly_data)
-    checker.check_statistical_anomaly(monthly_data)
-    checker.check_trend_breaks(monthly_data)
-    checker.check_cross_kpi_consistency(share_data, growth_data)
-
-    # ── 결과 저장 ──
+    # psycopg2 숫자형 type_code (NUMERIC/INT/FLOAT 계열) → float64 변환 대상
+    _NUMERIC_TYPE_CODES = {20, 21, 23, 700, 701, 1700}
+
+    # 여섯 SELECT는 상호 의존성이 없으므로 스레드 풀로 병렬 실행
+    # (적재 구간 wall time ≈ sum(query_time) → max(query_time))
+    SELECTS = {
+        "usage": "SELECT year_month, card_company, usage_amount FROM credit_card_usage",
+        "share": "SELECT year_month, card_company, market_share_pct, share_change_pp FROM kpi_market_share",
+        "growth": (
+            "SELECT year_month, card_company, current_amount, prev_month_amount, "
+            "prev_year_amount, mom_growth_rate, yoy_growth_rate FROM kpi_growth_rate"
+        ),
+        "activation": "SELECT year_month, card_company, activation_rate FROM kpi_activation_rate",
+        "monthly": "SELECT year_month, card_company, total_usage_amount FROM kpi_monthly_usage",
+        "category": (
+            "SELECT year_month, card_company, business_category, category_share_pct FROM kpi_category_usage"
+        ),
+    }
+
+    def _query(name: str) -> "ColumnBatch":
+        """서버 사이드 커서로 스트리밍 조회 → 컬럼별 NumPy 배열(SoA) 반환
+
+        fetchall + 행별 dict 생성 대신 named cursor로 itersize 단위 스트리밍하여
+        전체 행을 Python 객체로 올리지 않고 컬럼 단위로만 적재합니다.
+        psycopg2 커넥션은 스레드 간 공유가 안전하지 않으므로 워커별로
+        엔진 풀에서 하나씩 체크아웃합니다 (close 시 풀에 반환).
+        """
+        conn = _metrics_engine().raw_connection()
+        try:
+            cursor = conn.cursor(name=f"kpi_{name}")
+            cursor.itersize = 10000
+            cursor.execute(SELECTS[name])
+
+            # named cursor는 execute 후 첫 fetch 시점에 description이 채워짐
+            first_rows = cursor.fetchmany(cursor.itersize)
+            columns = [desc[0] for desc in cursor.description]
+            numeric = [desc[1] in _NUMERIC_TYPE_CODES for desc in cursor.description]
+
+            buffers: list = [[] for _ in columns]
+            rows = first_rows
+            while rows:
+                for row in rows:
+                    for buf, value in zip(buffers, row):
+                        buf.append(value)
+                rows = cursor.fetchmany(cursor.itersize)
+            cursor.close()
+        finally:
+            conn.close()
+
+        return ColumnBatch({
+            col: np.asarray(buf, dtype=np.float64 if is_num and None not in buf else object)
+            for col, is_num, buf in zip(columns, numeric, buffers)
+        })
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(SELECTS)) as executor:
+        batches = dict(zip(SELECTS, executor.map(_query, SELECTS)))
+
+    # ── 10종 검증 병렬 실행 ──
+    checker.run_all({
+        "usage": batches["usage"],
+        "share": batches["share"],
+        "category": batches["category"],
+        "growth": batches["growth"],
+        "activation": batches["activation"],
+        "monthly_usage": batches["monthly"],
+    })
+
+    # ── 결과 반환 (TaskFlow XCom) ──
     summary = checker.get_summary()
     checker.print_report()
 
-    context["ti"].xcom_push(key="check_summary", value=json.dumps(summary, ensure_ascii=False, default=str))
-    context["ti"].xcom_push(key="overall_status", value=summary["overall_status"])
-    context["ti"].xcom_push(key="critical_failures", value=summary["critical_failures"])
-    context["ti"].xcom_push(key="total_checks", value=summary["total_checks"])
-    context["ti"].xcom_push(key="pass_rate", value=summary["overall_pass_rate"])
-
-    return summary["overall_status"]
-
-
-def evaluate_results_task(**context) -> str:
-    """검증 결과에 따른 3-way 분기
-
-    재처리 전략:
-      - dag_run.conf.force_alert_level 로 강제 분기 가능 (테스트/디버깅용)
-      - 정상 흐름: CRITICAL → alert_critical, WARNING → alert_warning, PASS → log_success
-    """
-    # 수동 재처리 시 강제 알림 레벨 지정 지원
-    params = context.get("params", {})
-    force_level = params.get("force_alert_level")
-    if force_level in ("CRITICAL", "WARNING", "PASS"):
-        status = force_level
-    else:
-        status = context["ti"].xcom_pull(task_ids="integrity_checks.run_checks", key="overall_status")
-
-    if status == "CRITICAL":
-        return "alerting.alert_critical"
-    elif status == "WARNING":
-        return "alerting.alert_warning"
-    else:
-        return "alerting.log_success"
+    # XCom 페이로드 절감: 실패 상세 문자열은 500자로 절단 (알림/리포트 표기용으로 충분)
+    summary["failed_checks"] = [
+        {**c, "detail": c["detail"][:500]} for c in summary["failed_checks"]
+    ]
+    return summary
 
 
-def alert_critical_task(**context) -> None:
+def _send_critical_alert(summary: Dict[str, Any]) -> None:
     """CRITICAL 실패 알림 — 즉시 대응 필요"""
-    summary = json.loads(
-        context["ti"].xcom_pull(task_ids="integrity_checks.run_checks", key="check_summary")
-    )
-
     failed_items = "\n".join(
         f"  [{c['severity']}] {c['check_name']}: {c['detail']}"
         for c in summary.get("failed_checks", [])
@@ -292,20 +368,26 @@ def alert_critical_task(**context) -> None:
         f"{failed_items}"
     )
 
-    _send_slack_notification(message, severity="CRITICAL")
+    # WARNING 건은 별도 메시지 대신 같은 POST에 attachment 블록으로 동봉
+    warning_items = "\n".join(
+        f"  [{c['severity']}] {c['check_name']}: {c['detail']}"
+        for c in summary.get("failed_checks", [])
+        if c["severity"] == "WARNING"
+    )
+    extra = [{"color": "#d97706", "text": f"*WARNING 항목*\n{warning_items}"}] if warning_items else None
+
+    _send_slack_notification(message, severity="CRITICAL", extra_attachments=extra)
 
     # 메트릭 기록 (추후 모니터링 시스템 연동)
     print(f"metric.integrity.critical_failures={summary['critical_failures']}")
     print(f"metric.integrity.pass_rate={summary['overall_pass_rate']}")
 
 
-def escalate_to_oncall_task(**context) -> None:
+def _check_escalation(summary: Dict[str, Any]) -> None:
     """CRITICAL 2회 연속 시 온콜 에스컬레이션"""
     # 이전 실행 결과 확인 (실제 환경에서는 DB/Variable 조회)
     prev_status = Variable.get("prev_integrity_status", default_var="PASS")
-    current_status = context["ti"].xcom_pull(
-        task_ids="integrity_checks.run_checks", key="overall_status"
-    )
+    current_status = summary["overall_status"]
 
     if prev_status == "CRITICAL" and current_status == "CRITICAL":
         _send_slack_notification(
@@ -317,12 +399,8 @@ def escalate_to_oncall_task(**context) -> None:
     Variable.set("prev_integrity_status", current_status)
 
 
-def alert_warning_task(**context) -> None:
+def _send_warning_alert(summary: Dict[str, Any]) -> None:
     """WARNING 수준 알림"""
-    summary = json.loads(
-        context["ti"].xcom_pull(task_ids="integrity_checks.run_checks", key="check_summary")
-    )
-
     _send_slack_notification(
         f"*[WARNING] 지표 정합성 검증 경고*\n"
         f"  실패: {summary['failed']}건 | 통과율: {summary['overall_pass_rate']}%",
@@ -330,23 +408,49 @@ def alert_warning_task(**context) -> None:
     )
 
 
-def log_success_task(**context) -> None:
+def _log_success(summary: Dict[str, Any]) -> None:
     """전체 통과 로그"""
-    pass_rate = context["ti"].xcom_pull(task_ids="integrity_checks.run_checks", key="pass_rate")
-    total = context["ti"].xcom_pull(task_ids="integrity_checks.run_checks", key="total_checks")
+    pass_rate = summary["overall_pass_rate"]
+    total = summary["total_checks"]
     print(f"전체 정합성 검증 통과: {total}건, 통과율 {pass_rate}%")
     print(f"metric.integrity.pass_rate={pass_rate}")
 
 
-def generate_report_task(**context) -> None:
-    """일별 종합 리포트 생성 (CSV + JSON + HTML)"""
-    from scripts.run_integrity_checks import MetricsIntegrityChecker, load_config
+@task(task_id="notify", do_xcom_push=False)
+def notify_task(summary: Dict[str, Any], params: Dict[str, Any] = None) -> None:
+    """검증 결과에 따른 단일 알림 디스패치
+
+    기존 Branch + 3개 알림 태스크 다이아몬드를 태스크 하나로 축약 —
+    스케줄러가 순회할 엣지 수를 줄이고 SKIPPED 전파 고려가 불필요해짐.
+
+    재처리 전략:
+      - dag_run.conf.force_alert_level 로 강제 분기 가능 (테스트/디버깅용)
+      - 정상 흐름: CRITICAL → 알림, WARNING → 경고, PASS → 로그
+      - 에스컬레이션 상태 머신은 분기와 무관하게 매 실행 갱신
+    """
+    # 수동 재처리 시 강제 알림 레벨 지정 지원
+    force_level = (params or {}).get("force_alert_level")
+    if force_level in ("CRITICAL", "WARNING", "PASS"):
+        status = force_level
+    else:
+        status = summary["overall_status"]
+
+    if status == "CRITICAL":
+        _send_critical_alert(summary)
+    elif status == "WARNING":
+        _send_warning_alert(summary)
+    else:
+        _log_success(summary)
+
+    # prev_integrity_status는 PASS/WARNING 실행에서도 갱신되어야
+    # CRITICAL → PASS → CRITICAL이 "2회 연속"으로 오판되지 않음
+    _check_escalation(summary)
 
-    summary_json = context["ti"].xcom_pull(
-        task_ids="integrity_checks.run_checks", key="check_summary"
-    )
-    summary = json.loads(summary_json)
-    execution_date = context["ds"]
+
+@task(task_id="generate_report", do_xcom_push=False, dag=dag)
+def generate_report_task(summary: Dict[str, Any], ds: str = None) -> None:
+    """일별 종합 리포트 생성 (CSV + JSON + HTML)"""
+    execution_date = ds
 
     report_dir = os.path.join(PROJECT_DIR, "reports")
     os.makedirs(report_dir, exist_ok=True)
@@ -354,11 +458,17 @@ def generate_report_task(**context) -> None:
     # JSON 요약 저장
     report_path = os.path.join(report_dir, f"daily_summary_{execution_date}.json")
     with open(report_path, "w", encoding="utf-8") as f:
-        json.dump({
+        f.write(_json_dumps({
             "execution_date": execution_date,
             "pipeline": "metrics_quality_monitoring",
             **summary,
-        }, f, indent=2, ensure_ascii=False, default=str)
+        }))
+
+    # mtime 인덱스 append — cleanup이 전체 stat 없이 만료분만 삭제하도록 지원
+    import time
+
+    with open(os.path.join(report_dir, ".index"), "a", encoding="utf-8") as idx:
+        idx.write(f"{time.time()},{report_path}\n")
 
     print(f"리포트 저장: {report_path}")
     print(f"\n{'═' * 60}")
@@ -370,7 +480,8 @@ def generate_report_task(**context) -> None:
     print(f"{'═' * 60}")
 
 
-def cleanup_old_reports_task(**context) -> None:
+@task(task_id="cleanup_old_reports", trigger_rule=TriggerRule.ALL_DONE, do_xcom_push=False, dag=dag)
+def cleanup_old_reports_task() -> None:
     """보관 기간 초과 리포트 삭제"""
     report_dir = os.path.join(PROJECT_DIR, "reports")
     retention_days = DAG_CONFIG.get("reporting", {}).get("retention_days", 90)
@@ -378,27 +489,66 @@ def cleanup_old_reports_task(**context) -> None:
     if not os.path.exists(report_dir):
         return
 
-    import glob
+    import time
     from datetime import date, timedelta
 
-    cutoff = date.today() - timedelta(days=retention_days)
+    cutoff_ts = time.mktime((date.today() - timedelta(days=retention_days)).timetuple())
     removed = 0
 
-    for filepath in glob.glob(os.path.join(report_dir, "*")):
-        try:
-            mtime = datetime.fromtimestamp(os.path.getmtime(filepath)).date()
-            if mtime < cutoff:
-                os.remove(filepath)
+    # 1) mtime 인덱스 경로: generate_report가 append한 "ts,path" 라인 기준으로
+    #    만료분만 unlink — 삭제 실패분은 인덱스에 남겨 다음 실행에 재시도
+    index_path = os.path.join(report_dir, ".index")
+    indexed: set = set()
+    keep = []
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as idx:
+            lines = idx.readlines()
+
+        for line in lines:
+            ts_str, _, path = line.strip().partition(",")
+            try:
+                expired = float(ts_str) < cutoff_ts
+            except ValueError:
+                continue
+            indexed.add(path)
+            if not expired:
+                keep.append(line)
+                continue
+            try:
+                os.unlink(path)
                 removed += 1
-        except Exception:
-            pass
+            except FileNotFoundError:
+                pass  # 이미 사라진 파일 — 인덱스에서만 정리
+            except OSError:
+                keep.append(line)  # 삭제 실패 — 항목을 유지해 재시도 보장
+
+    # 2) 인덱스 밖 파일 병합 스캔: CLI(run_integrity_checks.py --output)가
+    #    같은 디렉토리에 쓴 리포트와 인덱스 도입 이전 파일도 누락 없이 관리.
+    #    만료분은 즉시 삭제하고 나머지는 인덱스에 편입
+    #    (scandir는 항목별 stat 정보를 캐시해 glob + getmtime 대비 syscall을 줄임)
+    with os.scandir(report_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or entry.name == ".index" or entry.path in indexed:
+                continue
+            mtime = entry.stat().st_mtime
+            if mtime < cutoff_ts:
+                try:
+                    os.unlink(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+            else:
+                keep.append(f"{mtime},{entry.path}\n")
+
+    with open(index_path, "w", encoding="utf-8") as idx:
+        idx.writelines(keep)
 
     if removed:
         print(f"{removed}개 오래된 리포트 삭제 (보관: {retention_days}일)")
 
 
 # ══════════════════════════════════════════════════════════
-# Task 정의 (TaskGroup 활용)
+# Task 정의 & 의존성 (TaskFlow)
 # ══════════════════════════════════════════════════════════
 
 # ── KPI 갱신 ──
@@ -410,111 +560,18 @@ refresh_kpis = PostgresOperator(
 )
 
 # ── 검증 TaskGroup ──
-if TaskGroup:
-    with TaskGroup("integrity_checks", dag=dag) as checks_group:
-        run_checks = PythonOperator(
-            task_id="run_checks",
-            python_callable=run_integrity_checks_task,
-            retries=3,  # 검증 태스크는 DB 연결 이슈로 재시도 여유 확보
-            retry_delay=timedelta(minutes=2),
-        )
-
-        evaluate = BranchPythonOperator(
-            task_id="evaluate",
-            python_callable=evaluate_results_task,
-        )
-
-        # TaskGroup 내부 의존성: run_checks 완료 후 evaluate 분기
-        run_checks >> evaluate
-else:
-    run_checks = PythonOperator(
-        task_id="run_checks",
-        python_callable=run_integrity_checks_task,
-        retries=3,
-        retry_delay=timedelta(minutes=2),
-        dag=dag,
-    )
-    evaluate = BranchPythonOperator(
-        task_id="evaluate",
-        python_callable=evaluate_results_task,
-        dag=dag,
-    )
-    run_checks >> evaluate
-
-# ── 알림 TaskGroup ──
-# BranchPythonOperator 하류 태스크는 NONE_FAILED_MIN_ONE_SUCCESS 필수:
-#   - Branch가 선택하지 않은 태스크는 SKIPPED 상태
-#   - 기본 trigger_rule(ALL_SUCCESS)면 SKIPPED를 실패로 간주하여 실행 불가
-if TaskGroup:
-    with TaskGroup("alerting", dag=dag) as alert_group:
-        alert_critical = PythonOperator(
-            task_id="alert_critical",
-            python_callable=alert_critical_task,
-            trigger_rule=TriggerRule.NONE_FAILED_MIN_ONE_SUCCESS,
-        )
-        escalate = PythonOperator(
-            task_id="escalate_to_oncall",
-            python_callable=escalate_to_oncall_task,
-            # escalate는 alert_critical 완료 후에만 실행 (ALL_DONE):
-            # alert_critical이 SKIPPED여도 escalate가 정리 로직 수행 가능
-            trigger_rule=TriggerRule.ALL_DONE,
-            retries=0,  # 에스컬레이션은 재시도 없이 즉시 판단
-        )
-        alert_warning = PythonOperator(
-            task_id="alert_warning",
-            python_callable=alert_warning_task,
-            trigger_rule=TriggerRule.NONE_FAILED_MIN_ONE_SUCCESS,
-        )
-        log_success = PythonOperator(
-            task_id="log_success",
-            python_callable=log_success_task,
-            trigger_rule=TriggerRule.NONE_FAILED_MIN_ONE_SUCCESS,
-        )
+# summary(XComArg)를 하류 태스크 인자로 전달 — 키별 xcom_pull 없이 단일 XCom 조회
+with TaskGroup("integrity_checks", dag=dag):
+    summary = run_integrity_checks_task()
 
-        # TaskGroup 내부 의존성: CRITICAL 경로만 escalate 연결
-        alert_critical >> escalate
-else:
-    alert_critical = PythonOperator(
-        task_id="alert_critical",
-        python_callable=alert_critical_task,
-        trigger_rule=TriggerRule.NONE_FAILED_MIN_ONE_SUCCESS,
-        dag=dag,
-    )
-    escalate = PythonOperator(
-        task_id="escalate_to_oncall",
-        python_callable=escalate_to_oncall_task,
-        trigger_rule=TriggerRule.ALL_DONE,
-        retries=0,
-        dag=dag,
-    )
-    alert_warning = PythonOperator(
-        task_id="alert_warning",
-        python_callable=alert_warning_task,
-        trigger_rule=TriggerRule.NONE_FAILED_MIN_ONE_SUCCESS,
-        dag=dag,
-    )
-    log_success = PythonOperator(
-        task_id="log_success",
-        python_callable=log_success_task,
-        trigger_rule=TriggerRule.NONE_FAILED_MIN_ONE_SUCCESS,
-        dag=dag,
-    )
-    alert_critical >> escalate
+# ── 알림 ──
+# Branch + 3개 알림 태스크 다이아몬드 대신 notify 태스크 하나가 severity 분기 담당
+with TaskGroup("alerting", dag=dag):
+    notify = notify_task(summary)
 
 # ── 리포트 ──
-generate_report = PythonOperator(
-    task_id="generate_report",
-    python_callable=generate_report_task,
-    trigger_rule=TriggerRule.NONE_FAILED_MIN_ONE_SUCCESS,
-    dag=dag,
-)
-
-cleanup_reports = PythonOperator(
-    task_id="cleanup_old_reports",
-    python_callable=cleanup_old_reports_task,
-    trigger_rule=TriggerRule.ALL_DONE,
-    dag=dag,
-)
+generate_report = generate_report_task(summary)
+cleanup_reports = cleanup_old_reports_task()
 
 
 # ══════════════════════════════════════════════════════════
@@ -522,20 +579,15 @@ cleanup_reports = PythonOperator(
 # ══════════════════════════════════════════════════════════
 #
 # 의존성 설계 원칙:
-#   1. Branch 하류 태스크는 NONE_FAILED_MIN_ONE_SUCCESS trigger_rule 사용
-#   2. escalate는 alert_critical의 직접 하류 → generate_report 상류에서 제외
-#      (escalate를 포함하면 SKIPPED 전파로 generate_report 실행 불가 위험)
-#   3. generate_report는 alerting 그룹의 leaf 태스크만 대기
-#   4. cleanup_reports는 ALL_DONE으로 항상 실행 (리포트 정리 보장)
+#   1. 알림 분기는 notify 태스크 내부의 Python 분기로 처리 —
+#      스케줄러가 순회할 엣지를 선형 체인 4개로 축소
+#   2. cleanup_reports는 ALL_DONE으로 항상 실행 (리포트 정리 보장)
 #
 # 재처리 시 dag_run.conf 활용:
 #   - {"skip_refresh": true} → refresh_kpis 결과 무시하고 검증 실행
 #   - {"rerun_checks_only": true} → 동일 효과
+#   - {"force_alert_level": "CRITICAL"} → notify 강제 분기 (테스트용)
 #
 
-refresh_kpis >> run_checks
-evaluate >> [alert_critical, alert_warning, log_success]
-# escalate는 alert_critical >> escalate 로 TaskGroup 내부에서 연결됨
-# generate_report 상류에서 제외하여 SKIPPED 전파 방지
-[alert_critical, alert_warning, log_success] >> generate_report
-generate_report >> cleanup_reports
+refresh_kpis >> summary
+notify >> generate_report >> cleanup_reports
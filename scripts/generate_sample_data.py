@@ -19,13 +19,13 @@ from __future__ import annotations
 
 import argparse
 import csv
-import math
 import os
-import random
 from dataclasses import dataclass
 from datetime import date
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 # ──────────────────────────────────────────────────────────
 # 상수 정의
 # ──────────────────────────────────────────────────────────
@@ -84,58 +84,89 @@ class IssuanceRecord:
     active_cards: int
 
 
-def _seasonal_factor(month: int) -> float:
-    """월별 계절 계수 — 1월 설날, 12월 연말 소비 증가"""
-    base = math.sin(2 * math.pi * (month - 3) / 12) * 0.06
+def _seasonal_factors() -> np.ndarray:
+    """월별 계절 계수 벡터 (길이 12) — 1월 설날, 11~12월 연말 소비 증가"""
+    months = np.arange(1, 13)
+    base = np.sin(2 * np.pi * (months - 3) / 12) * 0.06
     # 1월(설날) +3%, 11-12월(연말) +5%
-    holiday = 0.03 if month == 1 else (0.05 if month >= 11 else 0)
+    holiday = np.where(months == 1, 0.03, np.where(months >= 11, 0.05, 0.0))
     return 1.0 + base + holiday
 
 
+# 계절 계수는 입력이 12개 월로 고정 — import 시 1회 계산해 상수로 사용
+_SEASONAL = _seasonal_factors()
+
+# 생성 결과 캐시: 동일 (start_year, end_year, seed) 조합은 결정적이므로
+# 배열별 .npy로 저장해두고 재호출 시 mmap 로드로 계산을 건너뜀
+# (npz zip 컨테이너는 mmap_mode가 무시되므로 개별 np.save만 실제로 매핑됨)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "metrics-quality")
+
+
+def _cache_path(kind: str, start_year: int, end_year: int, seed: int, array: str) -> str:
+    return os.path.join(CACHE_DIR, f"{kind}_{start_year}_{end_year}_{seed}_{array}.npy")
+
+
 def generate_usage_data(
     start_year: int = 2024,
     end_year: int = 2025,
     seed: int = 42,
+    use_cache: bool = True,
 ) -> List[UsageRecord]:
-    """credit_card_usage 테이블 데이터 생성"""
-    random.seed(seed)
+    """credit_card_usage 테이블 데이터 생성 — NumPy 브로드캐스트 기반"""
+    n_years = end_year - start_year + 1
+    n_companies = len(CARD_COMPANIES)
+    n_categories = len(BUSINESS_CATEGORIES)
+
+    amount_path = _cache_path("usage", start_year, end_year, seed, "cat_amount")
+    count_path = _cache_path("usage", start_year, end_year, seed, "cat_count")
+    if use_cache and os.path.exists(amount_path) and os.path.exists(count_path):
+        cat_amount = np.load(amount_path, mmap_mode="r")
+        cat_count = np.load(count_path, mmap_mode="r")
+    else:
+        rng = np.random.default_rng(seed)
+
+        base = np.array([BASE_AMOUNTS[c] for c in CARD_COMPANIES], dtype=np.float64)
+        weights = np.array([CATEGORY_WEIGHTS[c] for c in BUSINESS_CATEGORIES], dtype=np.float64)
+        seasonal = _SEASONAL
+        yoy = 1 + np.arange(n_years) * 0.035  # 연 3.5% 성장
+
+        # (Y, 12, C) 카드사 월 총액 / 총 건수
+        company_noise = rng.uniform(0.96, 1.04, size=(n_years, 12, n_companies))
+        company_total = np.rint(
+            base[None, None, :] * yoy[:, None, None] * seasonal[None, :, None] * company_noise
+        )
+        avg_ticket = rng.uniform(8, 15, size=(n_years, 12, n_companies))
+        company_total_count = np.rint(company_total / avg_ticket)
+
+        # (Y, 12, C, K) 업종별 분배 — 마지막 업종이 잔여분 흡수
+        cat_noise = rng.uniform(0.85, 1.15, size=(n_years, 12, n_companies, n_categories))
+        cat_amount = np.rint(company_total[..., None] * weights[None, None, None, :] * cat_noise)
+        cat_count = np.rint(company_total_count[..., None] * weights[None, None, None, :] * cat_noise)
+        cat_amount[..., -1] = company_total - cat_amount[..., :-1].sum(axis=-1)
+        cat_count[..., -1] = company_total_count - cat_count[..., :-1].sum(axis=-1)
+        cat_amount = np.maximum(cat_amount, 0).astype(np.int64)
+        cat_count = np.maximum(cat_count, 0).astype(np.int64)
+
+        if use_cache:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            np.save(amount_path, cat_amount)
+            np.save(count_path, cat_count)
+
+    # 레코드 변환은 내보내기 경계에서 한 번만 수행
     records: List[UsageRecord] = []
-
-    for year in range(start_year, end_year + 1):
-        for month in range(1, 13):
-            ym = f"{year}-{month:02d}-01"
-            seasonal = _seasonal_factor(month)
-            yoy_growth = 1 + (year - start_year) * 0.035  # 연 3.5% 성장
-
-            for company in CARD_COMPANIES:
-                company_base = BASE_AMOUNTS[company]
-                company_noise = random.uniform(0.96, 1.04)
-                company_total = round(company_base * yoy_growth * seasonal * company_noise)
-                company_total_count = round(company_total / random.uniform(8, 15))
-
-                # 업종별 분배
-                remaining_amount = company_total
-                remaining_count = company_total_count
-
-                for i, category in enumerate(BUSINESS_CATEGORIES):
-                    weight = CATEGORY_WEIGHTS[category]
-                    cat_noise = random.uniform(0.85, 1.15)
-
-                    if i == len(BUSINESS_CATEGORIES) - 1:
-                        cat_amount = remaining_amount
-                        cat_count = remaining_count
-                    else:
-                        cat_amount = round(company_total * weight * cat_noise)
-                        cat_count = round(company_total_count * weight * cat_noise)
-                        remaining_amount -= cat_amount
-                        remaining_count -= cat_count
-
+    for yi in range(n_years):
+        for mi in range(12):
+            ym = f"{start_year + yi}-{mi + 1:02d}-01"
+            for ci, company in enumerate(CARD_COMPANIES):
+                amounts = cat_amount[yi, mi, ci].tolist()
+                counts = cat_count[yi, mi, ci].tolist()
+                for category, amount, count in zip(BUSINESS_CATEGORIES, amounts, counts):
                     records.append(UsageRecord(
                         year_month=ym,
                         card_company=company,
                         business_category=category,
-                        usage_amount=max(0, cat_amount),
-                        usage_count=max(0, cat_count),
+                        usage_amount=amount,
+                        usage_count=count,
                     ))
 
     return records
@@ -145,27 +176,49 @@ def generate_issuance_data(
     start_year: int = 2024,
     end_year: int = 2025,
     seed: int = 42,
+    use_cache: bool = True,
 ) -> List[IssuanceRecord]:
-    """card_issuance_stats 테이블 데이터 생성"""
-    random.seed(seed + 1)
-    records: List[IssuanceRecord] = []
+    """card_issuance_stats 테이블 데이터 생성 — NumPy 브로드캐스트 기반"""
+    n_years = end_year - start_year + 1
+    n_companies = len(CARD_COMPANIES)
+
+    issued_path = _cache_path("issuance", start_year, end_year, seed, "issued")
+    active_path = _cache_path("issuance", start_year, end_year, seed, "active")
+    if use_cache and os.path.exists(issued_path) and os.path.exists(active_path):
+        issued = np.load(issued_path, mmap_mode="r")
+        active = np.load(active_path, mmap_mode="r")
+    else:
+        rng = np.random.default_rng(seed + 1)
 
-    for year in range(start_year, end_year + 1):
-        for month in range(1, 13):
-            ym = f"{year}-{month:02d}-01"
+        base_issued = np.array(
+            [BASE_ISSUED_CARDS[c] * 10000 for c in CARD_COMPANIES], dtype=np.float64
+        )  # 만 → 장
+        growth = 1 + np.arange(n_years)[:, None] * 0.02 + np.arange(1, 13)[None, :] * 0.001
 
-            for company in CARD_COMPANIES:
-                base_issued = BASE_ISSUED_CARDS[company] * 10000  # 만 → 장
-                growth = 1 + (year - start_year) * 0.02 + month * 0.001
-                issued = round(base_issued * growth * random.uniform(0.99, 1.01))
-                activation_rate = random.uniform(0.62, 0.78)
-                active = round(issued * activation_rate)
+        issued = np.rint(
+            base_issued[None, None, :] * growth[..., None]
+            * rng.uniform(0.99, 1.01, size=(n_years, 12, n_companies))
+        ).astype(np.int64)
+        activation_rate = rng.uniform(0.62, 0.78, size=(n_years, 12, n_companies))
+        active = np.rint(issued * activation_rate).astype(np.int64)
 
+        if use_cache:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            np.save(issued_path, issued)
+            np.save(active_path, active)
+
+    records: List[IssuanceRecord] = []
+    for yi in range(n_years):
+        for mi in range(12):
+            ym = f"{start_year + yi}-{mi + 1:02d}-01"
+            issued_row = issued[yi, mi].tolist()
+            active_row = active[yi, mi].tolist()
+            for company, n_issued, n_active in zip(CARD_COMPANIES, issued_row, active_row):
                 records.append(IssuanceRecord(
                     year_month=ym,
                     card_company=company,
-                    total_issued_cards=issued,
-                    active_cards=active,
+                    total_issued_cards=n_issued,
+                    active_cards=n_active,
                 ))
 
     return records
@@ -175,15 +228,27 @@ def generate_issuance_data(
 # 출력 포맷터
 # ──────────────────────────────────────────────────────────
 
+# INSERT 1문당 행 수 — 단일 거대 statement 파싱 비용과 16MB 한도 회피
+INSERT_BATCH_SIZE = 1000
+
+
 def export_sql(
     usage: List[UsageRecord],
     issuance: List[IssuanceRecord],
     output_path: str,
 ) -> None:
-    """SQL INSERT 문 생성"""
+    """SQL INSERT 문 생성 — 1000행 단위 배치 INSERT"""
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
+    def _write_batched_inserts(f, table: str, columns: str, rows: List[str]) -> None:
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            batch = rows[start:start + INSERT_BATCH_SIZE]
+            f.write(f"INSERT INTO {table} {columns} VALUES\n")
+            f.write(",\n".join(batch))
+            f.write(";\n\n")
+
+    # 1MB 버퍼 + 배치당 str.join 1회 — 행마다 f.write를 호출하지 않음
+    with open(output_path, "w", encoding="utf-8", buffering=1024 * 1024) as f:
         f.write("-- 자동 생성된 샘플 데이터 (generate_sample_data.py)\n")
         f.write(f"-- 생성일: {date.today()}\n")
         f.write(f"-- 이용내역: {len(usage)}건, 발급통계: {len(issuance)}건\n\n")
@@ -191,62 +256,161 @@ def export_sql(
         f.write("TRUNCATE credit_card_usage;\n")
         f.write("TRUNCATE card_issuance_stats;\n\n")
 
-        f.write("INSERT INTO credit_card_usage "
-                "(year_month, card_company, business_category, usage_amount, usage_count) VALUES\n")
-        for i, r in enumerate(usage):
-            sep = "," if i < len(usage) - 1 else ";"
-            f.write(f"  ('{r.year_month}', '{r.card_company}', '{r.business_category}', "
-                    f"{r.usage_amount}, {r.usage_count}){sep}\n")
-
-        f.write("\nINSERT INTO card_issuance_stats "
-                "(year_month, card_company, total_issued_cards, active_cards) VALUES\n")
-        for i, r in enumerate(issuance):
-            sep = "," if i < len(issuance) - 1 else ";"
-            f.write(f"  ('{r.year_month}', '{r.card_company}', "
-                    f"{r.total_issued_cards}, {r.active_cards}){sep}\n")
+        _write_batched_inserts(
+            f,
+            "credit_card_usage",
+            "(year_month, card_company, business_category, usage_amount, usage_count)",
+            ["  ('%s', '%s', '%s', %d, %d)"
+             % (r.year_month, r.card_company, r.business_category, r.usage_amount, r.usage_count)
+             for r in usage],
+        )
+        _write_batched_inserts(
+            f,
+            "card_issuance_stats",
+            "(year_month, card_company, total_issued_cards, active_cards)",
+            ["  ('%s', '%s', %d, %d)"
+             % (r.year_month, r.card_company, r.total_issued_cards, r.active_cards)
+             for r in issuance],
+        )
 
     print(f"SQL 저장: {output_path}")
 
 
+def _copy_csv_block(rows: List[tuple]) -> str:
+    """COPY ... FROM STDIN 본문용 CSV 블록 생성"""
+    import io
+
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerows(rows)
+    return buf.getvalue()
+
+
+def export_copy(
+    usage: List[UsageRecord],
+    issuance: List[IssuanceRecord],
+    output_path: str,
+) -> None:
+    """COPY FROM STDIN 스크립트 생성 — INSERT 대비 SQL 파싱 비용 제거"""
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write("-- 자동 생성된 샘플 데이터 (generate_sample_data.py, COPY 포맷)\n")
+        f.write(f"-- 생성일: {date.today()}\n\n")
+
+        f.write("TRUNCATE credit_card_usage;\n")
+        f.write("TRUNCATE card_issuance_stats;\n\n")
+
+        f.write("COPY credit_card_usage "
+                "(year_month, card_company, business_category, usage_amount, usage_count) "
+                "FROM STDIN WITH (FORMAT csv);\n")
+        f.write(_copy_csv_block([
+            (r.year_month, r.card_company, r.business_category, r.usage_amount, r.usage_count)
+            for r in usage
+        ]))
+        f.write("\\.\n\n")
+
+        f.write("COPY card_issuance_stats "
+                "(year_month, card_company, total_issued_cards, active_cards) "
+                "FROM STDIN WITH (FORMAT csv);\n")
+        f.write(_copy_csv_block([
+            (r.year_month, r.card_company, r.total_issued_cards, r.active_cards)
+            for r in issuance
+        ]))
+        f.write("\\.\n")
+
+    print(f"COPY 스크립트 저장: {output_path}")
+
+
+def load_to_db(
+    usage: List[UsageRecord],
+    issuance: List[IssuanceRecord],
+    db_url: str,
+) -> None:
+    """PostgreSQL 직접 적재 — copy_expert로 COPY 프로토콜 사용"""
+    import io
+
+    import psycopg2
+
+    conn = psycopg2.connect(db_url)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("TRUNCATE credit_card_usage")
+            cur.execute("TRUNCATE card_issuance_stats")
+
+            usage_buf = io.StringIO(_copy_csv_block([
+                (r.year_month, r.card_company, r.business_category, r.usage_amount, r.usage_count)
+                for r in usage
+            ]))
+            cur.copy_expert(
+                "COPY credit_card_usage "
+                "(year_month, card_company, business_category, usage_amount, usage_count) "
+                "FROM STDIN WITH (FORMAT csv)",
+                usage_buf,
+            )
+
+            issuance_buf = io.StringIO(_copy_csv_block([
+                (r.year_month, r.card_company, r.total_issued_cards, r.active_cards)
+                for r in issuance
+            ]))
+            cur.copy_expert(
+                "COPY card_issuance_stats "
+                "(year_month, card_company, total_issued_cards, active_cards) "
+                "FROM STDIN WITH (FORMAT csv)",
+                issuance_buf,
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+    print(f"DB 적재 완료: 이용내역 {len(usage)}건, 발급통계 {len(issuance)}건")
+
+
 def export_csv(
     usage: List[UsageRecord],
     issuance: List[IssuanceRecord],
     output_dir: str,
 ) -> None:
-    """CSV 파일 생성"""
+    """CSV 파일 생성 — pandas C 라이터 사용"""
+    import pandas as pd
+
     os.makedirs(output_dir, exist_ok=True)
 
     usage_path = os.path.join(output_dir, "credit_card_usage.csv")
-    with open(usage_path, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.writer(f)
-        writer.writerow(["year_month", "card_company", "business_category", "usage_amount", "usage_count"])
-        for r in usage:
-            writer.writerow([r.year_month, r.card_company, r.business_category, r.usage_amount, r.usage_count])
+    pd.DataFrame.from_records(
+        [(r.year_month, r.card_company, r.business_category, r.usage_amount, r.usage_count) for r in usage],
+        columns=["year_month", "card_company", "business_category", "usage_amount", "usage_count"],
+    ).to_csv(usage_path, index=False, encoding="utf-8-sig", chunksize=50_000)
 
     issuance_path = os.path.join(output_dir, "card_issuance_stats.csv")
-    with open(issuance_path, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.writer(f)
-        writer.writerow(["year_month", "card_company", "total_issued_cards", "active_cards"])
-        for r in issuance:
-            writer.writerow([r.year_month, r.card_company, r.total_issued_cards, r.active_cards])
+    pd.DataFrame.from_records(
+        [(r.year_month, r.card_company, r.total_issued_cards, r.active_cards) for r in issuance],
+        columns=["year_month", "card_company", "total_issued_cards", "active_cards"],
+    ).to_csv(issuance_path, index=False, encoding="utf-8-sig", chunksize=50_000)
 
     print(f"CSV 저장: {usage_path}, {issuance_path}")
 
 
 def main():
     parser = argparse.ArgumentParser(description="샘플 데이터 생성기")
-    parser.add_argument("--format", choices=["sql", "csv"], default="sql")
+    parser.add_argument("--format", choices=["sql", "copy", "csv"], default="sql")
     parser.add_argument("--output", type=str, default="data/seed.sql")
+    parser.add_argument("--db-url", type=str, help="PostgreSQL 연결 URL (직접 적재)")
     parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-cache", action="store_true", help=".npy 캐시 무시하고 재생성")
     args = parser.parse_args()
 
-    usage = generate_usage_data(seed=args.seed)
-    issuance = generate_issuance_data(seed=args.seed)
+    usage = generate_usage_data(seed=args.seed, use_cache=not args.no_cache)
+    issuance = generate_issuance_data(seed=args.seed, use_cache=not args.no_cache)
 
     print(f"생성 완료: 이용내역 {len(usage)}건, 발급통계 {len(issuance)}건")
 
-    if args.format == "sql":
+    if args.db_url:
+        load_to_db(usage, issuance, args.db_url)
+    elif args.format == "sql":
         export_sql(usage, issuance, args.output)
+    elif args.format == "copy":
+        export_copy(usage, issuance, args.output)
     else:
         export_csv(usage, issuance, args.output)
 
@@ -22,21 +22,50 @@ KPI 지표 간 교차 검증을 실행하고 CSV / JSON / HTML 리포트를 생
 from __future__ import annotations
 
 import argparse
-import csv
+import copy
+import gc
+import hashlib
 import json
 import logging
 import math
 import os
-import statistics
+import pickle
 import sys
-from collections import defaultdict
-from dataclasses import asdict, dataclass, field
+import tempfile
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
-import yaml
+import numpy as np
+import pandas as pd
+
+# 선택 의존성: orjson(C 확장)이 있으면 JSON 리포트 직렬화에 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 선택 의존성: numba가 있으면 추세 탐지 커널을 JIT 컴파일하고,
+# 없으면 동일한 순수 파이썬 구현으로 동작 (결과 동일, 속도만 차이)
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def _decorator(func):
+            return func
+
+        if args and callable(args[0]):
+            return args[0]
+        return _decorator
 
 # ──────────────────────────────────────────────────────────
 # 로깅 설정
@@ -64,9 +93,13 @@ class CheckStatus(str, Enum):
     FAIL = "FAIL"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IntegrityCheckResult:
-    """정합성 검증 결과 단위"""
+    """정합성 검증 결과 단위
+
+    한 번의 실행에서 수만 건까지 생성되므로 __dict__ 없는 슬롯 인스턴스로
+    메모리를 절감하고, 생성 후에는 변경 불가(frozen)로 고정합니다.
+    """
     check_name: str
     check_category: str
     severity: str
@@ -86,6 +119,168 @@ class IntegrityCheckResult:
     def is_critical_failure(self) -> bool:
         return not self.is_passed and self.severity == Severity.CRITICAL
 
+    def _as_tuple(self) -> tuple:
+        """CSV 내보내기용 필드 튜플 — asdict의 dict 재구성 비용을 피함"""
+        return (
+            self.check_name, self.check_category, self.severity,
+            self.expected_value, self.actual_value, self.difference,
+            self.tolerance, self.status, self.detail, self.timestamp,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 dict — asdict의 필드 리플렉션 없이 직접 구성"""
+        return {
+            "check_name": self.check_name,
+            "check_category": self.check_category,
+            "severity": self.severity,
+            "expected_value": self.expected_value,
+            "actual_value": self.actual_value,
+            "difference": self.difference,
+            "tolerance": self.tolerance,
+            "status": self.status,
+            "detail": self.detail,
+            "timestamp": self.timestamp,
+        }
+
+
+# HTML 리포트 공통 스타일 — 정적 블록이므로 모듈 로드 시 한 번만 생성
+_HTML_STYLE = """
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: -apple-system, 'Pretendard', sans-serif; background: #f8fafc; color: #1e293b; padding: 2rem; }
+        .container { max-width: 1200px; margin: 0 auto; }
+        h1 { font-size: 1.5rem; margin-bottom: 0.25rem; }
+        .subtitle { color: #64748b; margin-bottom: 2rem; }
+
+        .kpi-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 1rem; margin-bottom: 2rem; }
+        .kpi-card { background: white; border-radius: 12px; padding: 1.25rem; box-shadow: 0 1px 3px rgba(0,0,0,.08); }
+        .kpi-label { font-size: 0.8rem; color: #64748b; margin-bottom: 4px; }
+        .kpi-value { font-size: 1.75rem; font-weight: 700; }
+        .kpi-value.pass { color: #10b981; }
+        .kpi-value.fail { color: #ef4444; }
+
+        table { width: 100%; border-collapse: collapse; background: white; border-radius: 12px; overflow: hidden; box-shadow: 0 1px 3px rgba(0,0,0,.08); margin-bottom: 2rem; }
+        th { background: #f1f5f9; text-align: left; padding: 0.75rem 1rem; font-size: 0.8rem; color: #475569; text-transform: uppercase; letter-spacing: 0.05em; }
+        td { padding: 0.65rem 1rem; border-top: 1px solid #f1f5f9; font-size: 0.875rem; }
+        .num { text-align: right; font-variant-numeric: tabular-nums; }
+        .pass { color: #10b981; }
+        .fail { color: #ef4444; }
+        .pass-row { background: #f0fdf4; }
+        .fail-row { background: #fef2f2; }
+
+        .badge { display: inline-block; padding: 2px 8px; border-radius: 6px; font-size: 0.7rem; font-weight: 600; }
+        .badge.critical { background: #fee2e2; color: #dc2626; }
+        .badge.warning { background: #fef3c7; color: #d97706; }
+        .badge.info { background: #dbeafe; color: #2563eb; }
+
+        .section-title { font-size: 1.1rem; font-weight: 600; margin: 1.5rem 0 0.75rem; }
+        details { margin-bottom: 2rem; }
+        summary { cursor: pointer; font-weight: 600; padding: 0.5rem 0; }
+    """
+
+# 문서 골격의 정적 구간 — import 시 한 번만 조립하고 호출마다 재평가하지 않음
+_HTML_HEAD = f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>{_HTML_STYLE}</style>
+"""
+
+_HTML_FOOT = """
+</div>
+</body>
+</html>"""
+
+# 상수 구간은 import 시 UTF-8로 미리 인코딩해 리포트마다 재인코딩하지 않음
+_HTML_HEAD_B = _HTML_HEAD.encode("utf-8")
+_HTML_FOOT_B = _HTML_FOOT.encode("utf-8")
+
+
+# CSV 리포트 헤더 — IntegrityCheckResult._as_tuple 필드 순서와 일치
+_CSV_FIELDNAMES = (
+    "check_name", "check_category", "severity",
+    "expected_value", "actual_value", "difference",
+    "tolerance", "status", "detail", "timestamp",
+)
+
+
+class ColumnBatch:
+    """컬럼 지향(SoA) 데이터 배치
+
+    DB에서 스트리밍 적재한 컬럼별 NumPy 배열을 보관하면서,
+    기존 검증 메서드가 기대하는 행 단위(dict) 순회 인터페이스를 제공합니다.
+    행마다 dict를 미리 생성하지 않으므로 list[dict] 대비 메모리 사용이 크게 줄어듭니다.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns = columns
+        lengths = {len(arr) for arr in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"컬럼 길이 불일치: { {k: len(v) for k, v in columns.items()} }")
+        self._length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        names = list(self.columns.keys())
+        arrays = [self.columns[n] for n in names]
+        for i in range(self._length):
+            yield {name: arr[i] for name, arr in zip(names, arrays)}
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+
+def _as_dataframe(data, fields: Sequence[str]) -> pd.DataFrame:
+    """검증 입력(list[dict] 또는 ColumnBatch)을 DataFrame으로 변환
+
+    ColumnBatch는 이미 컬럼 배열이므로 zero-copy에 가깝게 래핑되고,
+    list[dict]는 필요한 필드만 한 번 순회로 추출합니다.
+    """
+    if isinstance(data, ColumnBatch):
+        return pd.DataFrame({f: data.columns[f] for f in fields if f in data.columns})
+    return pd.DataFrame([{f: row.get(f) for f in fields} for row in data], columns=list(fields))
+
+
+def _to_soa(data, fields: Sequence[str]) -> Dict[str, np.ndarray]:
+    """행 목록(list[dict] 또는 ColumnBatch)을 필드별 float64 배열로 변환
+
+    행마다 dict.get + float() 를 반복하는 대신 한 번의 순회로 연속된
+    배열(SoA)을 채웁니다. 결측/비수치 값은 NaN으로 통일해 이후
+    np.isfinite 마스크로 거릅니다.
+    """
+    n = len(data)
+    if isinstance(data, ColumnBatch):
+        out = {}
+        for f in fields:
+            col = data.columns.get(f)
+            if col is None:
+                out[f] = np.full(n, np.nan)
+            else:
+                out[f] = pd.to_numeric(pd.Series(col), errors="coerce").to_numpy(dtype=np.float64)
+        return out
+
+    arrays = {f: np.empty(n, dtype=np.float64) for f in fields}
+    for i, row in enumerate(data):
+        for f in fields:
+            v = row.get(f)
+            try:
+                arrays[f][i] = float(v)
+            except (TypeError, ValueError):
+                arrays[f][i] = np.nan
+    return arrays
+
+
+def _str_column(data, field: str) -> List[str]:
+    """detail 문자열 구성에 쓰이는 텍스트 컬럼 추출"""
+    if isinstance(data, ColumnBatch):
+        col = data.columns.get(field)
+        if col is None:
+            return [""] * len(data)
+        return [str(v) for v in col]
+    return [str(row.get(field, "")) for row in data]
+
 
 @dataclass
 class ThresholdConfig:
@@ -121,6 +316,8 @@ _THRESHOLD_SCHEMA: Dict[str, Dict[str, type]] = {
 }
 
 _VALID_SEVERITIES = {"CRITICAL", "WARNING", "INFO"}
+# 오류 메시지용 표기 — 호출마다 sorted+join을 반복하지 않도록 미리 조립
+_VALID_SEVERITIES_STR = ", ".join(sorted(_VALID_SEVERITIES))
 
 _REQUIRED_SECTIONS = ["thresholds"]
 
@@ -179,7 +376,7 @@ def validate_config_schema(config: Dict[str, Any]) -> List[str]:
         if isinstance(sev, str) and sev not in _VALID_SEVERITIES:
             errors.append(
                 f"thresholds.{key}.severity 값 오류: '{sev}' "
-                f"(허용: {', '.join(sorted(_VALID_SEVERITIES))})"
+                f"(허용: {_VALID_SEVERITIES_STR})"
             )
 
     # 4) reporting 섹션 검증 (존재 시)
@@ -204,6 +401,28 @@ def validate_config_schema(config: Dict[str, Any]) -> List[str]:
 # 설정 로더
 # ══════════════════════════════════════════════════════════
 
+_CONFIG_CACHE_DIR = Path.home() / ".cache" / "metrics_quality"
+
+# 프로세스 내 재호출용 메모 — 경로별 (stat 시그니처, 머지 완료 설정).
+# 사이드카 pickle보다 한 단계 앞의 캐시로, 디스크 접근 자체를 건너뜀
+_CONFIG_MEMO: "OrderedDict[str, tuple]" = OrderedDict()
+_CONFIG_MEMO_MAX = 100
+
+
+def _config_cache_path(config_path: str, mtime: float, size: int) -> Path:
+    """원본 YAML의 경로+mtime+크기로 키가 바뀌는 사이드카 캐시 경로"""
+    key = f"{os.path.abspath(config_path)}:{mtime}:{size}".encode()
+    return _CONFIG_CACHE_DIR / f"cfg_{hashlib.sha1(key).hexdigest()}.pkl"
+
+
+def _remember_config(path: str, sig: tuple, config: Dict[str, Any]) -> None:
+    """프로세스 내 설정 메모 갱신 — 상한 초과 시 가장 오래된 항목부터 제거"""
+    _CONFIG_MEMO[path] = (sig, copy.deepcopy(config))
+    _CONFIG_MEMO.move_to_end(path)
+    while len(_CONFIG_MEMO) > _CONFIG_MEMO_MAX:
+        _CONFIG_MEMO.popitem(last=False)
+
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """YAML 설정 파일 로드 — 없으면 기본값 사용
 
@@ -239,6 +458,30 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     }
 
     if config_path and Path(config_path).exists():
+        # YAML 파싱은 pickle 대비 수십 배 느리므로, 원본이 바뀌지 않았으면
+        # 머지 완료된 설정을 사이드카 캐시에서 바로 되살립니다.
+        stat = os.stat(config_path)
+        sig = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        memo = _CONFIG_MEMO.get(config_path)
+        if memo is not None and memo[0] == sig:
+            _CONFIG_MEMO.move_to_end(config_path)
+            # 호출자 변조가 캐시를 오염시키지 않도록 사본 반환
+            return copy.deepcopy(memo[1])
+
+        cache_file = _config_cache_path(config_path, stat.st_mtime, stat.st_size)
+        if cache_file.exists():
+            try:
+                with open(cache_file, "rb") as f:
+                    cached = pickle.load(f)
+                logger.info("설정 캐시 적중: %s", config_path)
+                _remember_config(config_path, sig, cached)
+                return cached
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass  # 캐시 손상 시 원본 파싱으로 폴백
+
+        import yaml  # 캐시 미스 시에만 필요 — 콜드 스타트 절감
+
         with open(config_path, "r", encoding="utf-8") as f:
             user_cfg = yaml.safe_load(f)
 
@@ -274,6 +517,17 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
                 else:
                     defaults[section] = user_cfg[section]
         logger.info("설정 로드 완료: %s", config_path)
+
+        try:
+            _CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=_CONFIG_CACHE_DIR, delete=False
+            ) as tmp:
+                pickle.dump(defaults, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp.name, cache_file)  # 원자적 교체 — 동시 실행 안전
+        except OSError:
+            pass  # 캐시 기록 실패는 치명적이지 않음
+        _remember_config(config_path, sig, defaults)
     else:
         logger.info("기본 설정 사용 (YAML 파일 없음)")
 
@@ -286,39 +540,125 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
 
 def calc_z_score(value: float, values: Sequence[float]) -> Optional[float]:
     """Z-Score 계산 (모집단 기준)"""
-    if len(values) < 2:
+    n = len(values)
+    if n < 2:
         return None
-    mean = statistics.mean(values)
-    stdev = statistics.pstdev(values)
+    if min(values) == max(values):  # 전부 동일 — stdev 0 확정
+        return 0.0
+    if n < 64:
+        # 소규모 입력은 배열 변환 비용 없이 fsum(보정 합산)으로 처리
+        mean = math.fsum(values) / n
+        stdev = math.sqrt(math.fsum((x - mean) ** 2 for x in values) / n)
+    else:
+        arr = np.asarray(values, dtype=np.float64)
+        mean = float(arr.mean())
+        stdev = float(arr.std())
     if stdev == 0:
         return 0.0
     return round((value - mean) / stdev, 3)
 
 
+def calc_z_scores_batch(values: Sequence[float]) -> np.ndarray:
+    """시리즈 전체의 Z-Score를 한 번에 산출 (모집단 기준)
+
+    대규모·고자릿수 입력은 수치 안정성을 위해 Welford 단일 패스를,
+    그 외에는 numpy 기본 통계를 사용합니다.
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    if len(arr) > 1024 or np.abs(arr).max() > 1e9:
+        mu, sigma = _welford_mean_std(arr)
+    else:
+        mu = arr.mean()
+        sigma = arr.std()
+    if sigma == 0:
+        return np.zeros_like(arr)
+    return np.round((arr - mu) / sigma, 3)
+
+
 def calc_iqr_bounds(values: Sequence[float]) -> tuple[float, float]:
-    """IQR 기반 이상치 경계 산출"""
-    sorted_v = sorted(values)
-    n = len(sorted_v)
-    q1 = sorted_v[n // 4]
-    q3 = sorted_v[(3 * n) // 4]
+    """IQR 기반 이상치 경계 산출
+
+    필요한 순서통계량은 Q1/Q3 두 개뿐이므로 전체 정렬(O(n log n)) 대신
+    np.partition(introselect, 평균 O(n))으로 해당 위치만 정렬합니다.
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    n = len(arr)
+    q1_idx, q3_idx = n // 4, (3 * n) // 4
+    parted = np.partition(arr, [q1_idx, q3_idx])
+    q1 = float(parted[q1_idx])
+    q3 = float(parted[q3_idx])
     iqr = q3 - q1
     return q1 - 1.5 * iqr, q3 + 1.5 * iqr
 
 
+@njit(cache=True)
+def _welford_mean_std(a: np.ndarray) -> tuple:
+    """단일 패스 Welford 평균/표준편차 (모집단 기준)
+
+    합계 기반 2-pass 공식은 수십억 단위 금액에서 유효 자릿수를
+    잃을 수 있어, 대형 배열에는 수치적으로 안정적인 이 경로를 사용합니다.
+    """
+    m = 0.0
+    m2 = 0.0
+    n = 0
+    for x in a:
+        n += 1
+        d = x - m
+        m += d / n
+        m2 += d * (x - m)
+    if n == 0:
+        return 0.0, 0.0
+    return m, (m2 / n) ** 0.5
+
+
+@njit(cache=True)
+def _trend_break_kernel(
+    values: np.ndarray, window: int, threshold_sigma: float
+) -> List[int]:
+    """급변 탐지 커널 — 윈도우 합/제곱합을 갱신하며 단일 패스로 탐지"""
+    breaks = []
+    s = 0.0
+    sq = 0.0
+    for i in range(window):
+        s += values[i]
+        sq += values[i] * values[i]
+
+    for i in range(window, values.shape[0]):
+        mean = s / window
+        var = sq / window - mean * mean
+        if var < 0.0:
+            var = 0.0
+        std = var ** 0.5
+        if std == 0.0:
+            std = 1.0
+        if abs(values[i] - mean) > threshold_sigma * std:
+            breaks.append(i)
+        s += values[i] - values[i - window]
+        sq += values[i] * values[i] - values[i - window] * values[i - window]
+    return breaks
+
+
 def detect_trend_break(
     values: Sequence[float], window: int = 3, threshold_sigma: float = 2.0
 ) -> List[int]:
     """이동평균 대비 급변 구간 탐지 — 인덱스 반환"""
     if len(values) < window + 1:
         return []
-
-    breaks = []
-    for i in range(window, len(values)):
-        moving_avg = statistics.mean(values[i - window : i])
-        moving_std = statistics.pstdev(values[i - window : i]) or 1.0
-        if abs(values[i] - moving_avg) > threshold_sigma * moving_std:
-            breaks.append(i)
-    return breaks
+    arr = np.asarray(values, dtype=np.float64)
+    if _HAS_NUMBA:
+        return [int(i) for i in _trend_break_kernel(arr, window, threshold_sigma)]
+
+    # numba 미설치 시: 접두 누적합 2개(S1, S2)로 모든 윈도우의
+    # 평균/분산을 O(1)에 구하고 급변 여부를 한 번에 판정
+    c1 = np.concatenate(([0.0], np.cumsum(arr)))
+    c2 = np.concatenate(([0.0], np.cumsum(arr * arr)))
+    idx = np.arange(window, len(arr))
+    means = (c1[idx] - c1[idx - window]) / window
+    variances = np.maximum((c2[idx] - c2[idx - window]) / window - means * means, 0.0)
+    stds = np.sqrt(variances)
+    stds[stds == 0.0] = 1.0
+    breaks = idx[np.abs(arr[idx] - means) > threshold_sigma * stds]
+    return [int(i) for i in breaks]
 
 
 # ══════════════════════════════════════════════════════════
@@ -342,46 +682,149 @@ class MetricsIntegrityChecker:
         self.connection = connection
         self.config = config or load_config()
         self.results: List[IntegrityCheckResult] = []
+        self._summary_cache: Optional[Dict[str, Any]] = None
         self.check_date = date.today()
         self._thresholds = self.config.get("thresholds", {})
+        # 임계값 조회 메모 — 인스턴스 수명에 묶여 reset()과 무관하게 유효
+        self._threshold_cache: Dict[str, Dict[str, Any]] = {}
+        # 입력 리스트별 SoA 변환 메모 — 같은 입력을 받는 검증 간 재사용
+        self._soa_cache: Dict[int, tuple] = {}
+
+    def reset(self) -> None:
+        """결과와 요약 캐시 초기화 — 인스턴스 재사용 시 재할당 없이 호출"""
+        self.results.clear()
+        self._summary_cache = None
+        self._soa_cache.clear()
+
+    def _soa(self, data: List[Dict], fields: tuple) -> Dict[str, np.ndarray]:
+        """입력별 SoA 변환 메모
+
+        입력 리스트에 강한 참조를 유지해 엔트리 수명 동안 id()가 재사용되지
+        않도록 보장합니다. 컬럼은 입력당 하나의 dict에 누적되므로 서로 다른
+        검증이 요구하는 필드가 겹치면 변환을 재사용합니다(reset()으로 해제).
+        """
+        entry = self._soa_cache.get(id(data))
+        if entry is None or entry[0] is not data:
+            entry = (data, {})
+            self._soa_cache[id(data)] = entry
+        cols = entry[1]
+        missing = tuple(f for f in fields if f not in cols)
+        if missing:
+            cols.update(_to_soa(data, missing))
+        return {f: cols[f] for f in fields}
 
     def _get_threshold(self, key: str) -> Dict[str, Any]:
-        return self._thresholds.get(key, {"tolerance": 0, "severity": "WARNING"})
+        cfg = self._threshold_cache.get(key)
+        if cfg is None:
+            cfg = self._thresholds.get(key, {"tolerance": 0, "severity": "WARNING"})
+            self._threshold_cache[key] = cfg
+        return cfg
+
+    def _record(self, results: List[IntegrityCheckResult]) -> List[IntegrityCheckResult]:
+        """검증 결과 반영 — 요약 캐시를 함께 무효화"""
+        self.results.extend(results)
+        self._summary_cache = None
+        return results
 
     # ──────────────────────────────────────────────────────
     # CHECK 1: 합계 정합성
     # ──────────────────────────────────────────────────────
     def check_sum_integrity(self, data: List[Dict]) -> List[IntegrityCheckResult]:
         """전체 이용금액 = 카드사별 합계"""
+        if not data:  # 빈 입력 빠른 경로 — 할당 없이 즉시 반환
+            return []
         cfg = self._get_threshold("sum_integrity")
+        tol = cfg.get("tolerance", 1)
+        severity = cfg.get("severity", "CRITICAL")
         results = []
 
-        monthly: Dict[str, Dict] = defaultdict(lambda: {"total": 0, "by_company": defaultdict(float)})
-        for row in data:
-            ym = str(row.get("year_month", ""))
-            amount = float(row.get("usage_amount", 0))
-            company = row.get("card_company", "")
-            monthly[ym]["total"] += amount
-            monthly[ym]["by_company"][company] += amount
+        df = _as_dataframe(data, ("year_month", "card_company", "usage_amount"))
+        if not df.empty:
+            df["year_month"] = df["year_month"].astype(str)
+            df["usage_amount"] = pd.to_numeric(df["usage_amount"], errors="coerce").fillna(0.0)
+
+            # 행 단위 defaultdict 집계 대신 C 구현 groupby 2회로 월별 합계 산출
+            totals = df.groupby("year_month", sort=True)["usage_amount"].sum()
+            company_sums = (
+                df.groupby(["year_month", "card_company"], sort=False)["usage_amount"]
+                .sum()
+                .groupby(level=0)
+                .sum()
+            )
 
-        for ym, totals in sorted(monthly.items()):
-            company_sum = sum(totals["by_company"].values())
-            diff = abs(totals["total"] - company_sum)
-            tol = cfg.get("tolerance", 1)
+            for ym, total in totals.items():
+                # numpy 스칼라가 결과/JSON에 새지 않도록 네이티브 float로 캐스팅
+                total = float(total)
+                company_sum = float(company_sums[ym])
+                diff = abs(total - company_sum)
 
-            results.append(IntegrityCheckResult(
-                check_name="전체 이용금액 = 카드사별 합계",
-                check_category="sum_integrity",
-                severity=cfg.get("severity", "CRITICAL"),
-                expected_value=round(totals["total"], 2),
-                actual_value=round(company_sum, 2),
-                difference=round(diff, 2),
-                tolerance=tol,
+                results.append(IntegrityCheckResult(
+                    check_name="전체 이용금액 = 카드사별 합계",
+                    check_category="sum_integrity",
+                    severity=severity,
+                    expected_value=round(total, 2),
+                    actual_value=round(company_sum, 2),
+                    difference=round(diff, 2),
+                    tolerance=tol,
+                    status=CheckStatus.PASS if diff < tol else CheckStatus.FAIL,
+                    detail=f"year_month={ym}",
+                ))
+
+        return self._record(results)
+
+    def _check_ratio_sums(
+        self,
+        data,
+        group_cols: List[str],
+        value_col: str,
+        expected: float,
+        cfg_key: str,
+        check_name: str,
+        default_tolerance: float,
+        default_severity: str,
+    ) -> List[IntegrityCheckResult]:
+        """그룹 합계 = 기대값 검증 공통 프리미티브
+
+        점유율/업종비율처럼 "그룹 합이 100%인가"류 검증을 한 번의
+        DataFrame 스캔 + groupby 합산으로 처리합니다.
+        """
+        cfg = self._get_threshold(cfg_key)
+        tol = cfg.get("tolerance", default_tolerance)
+        severity = cfg.get("severity", default_severity)
+        results = []
+
+        df = _as_dataframe(data, (*group_cols, value_col))
+        if df.empty:
+            return results
+        for col in group_cols:
+            df[col] = df[col].astype(str)
+        df[value_col] = pd.to_numeric(df[value_col], errors="coerce").fillna(0.0)
+
+        totals = df.groupby(group_cols, sort=True)[value_col].sum()
+        diffs = (expected - totals).abs()
+
+        # 행마다 동일한 메타데이터 인자는 partial로 미리 바인딩
+        make_result = partial(
+            IntegrityCheckResult,
+            check_name=check_name,
+            check_category="ratio_integrity",
+            severity=severity,
+            expected_value=expected,
+            tolerance=tol,
+        )
+        single_key = len(group_cols) == 1
+        for key, total, diff in zip(totals.index, totals.to_numpy(), diffs.to_numpy()):
+            detail = (
+                "year_month=%s" % key
+                if single_key
+                else "year_month=%s, company=%s" % key
+            )
+            results.append(make_result(
+                actual_value=round(float(total), 2),
+                difference=round(float(diff), 2),
                 status=CheckStatus.PASS if diff < tol else CheckStatus.FAIL,
-                detail=f"year_month={ym}",
+                detail=detail,
             ))
-
-        self.results.extend(results)
         return results
 
     # ──────────────────────────────────────────────────────
@@ -391,32 +834,19 @@ class MetricsIntegrityChecker:
         self, share_data: List[Dict]
     ) -> List[IntegrityCheckResult]:
         """시장 점유율 합계 = 100% 검증"""
-        cfg = self._get_threshold("ratio_market_share")
-        results = []
-
-        monthly_shares: Dict[str, float] = defaultdict(float)
-        for row in share_data:
-            ym = str(row.get("year_month", ""))
-            monthly_shares[ym] += float(row.get("market_share_pct", 0))
-
-        for ym, total_share in sorted(monthly_shares.items()):
-            diff = abs(100.0 - total_share)
-            tol = cfg.get("tolerance", 0.1)
-
-            results.append(IntegrityCheckResult(
-                check_name="시장 점유율 합계 = 100%",
-                check_category="ratio_integrity",
-                severity=cfg.get("severity", "CRITICAL"),
-                expected_value=100.0,
-                actual_value=round(total_share, 2),
-                difference=round(diff, 2),
-                tolerance=tol,
-                status=CheckStatus.PASS if diff < tol else CheckStatus.FAIL,
-                detail=f"year_month={ym}",
-            ))
-
-        self.results.extend(results)
-        return results
+        if not share_data:  # 빈 입력 빠른 경로 — 할당 없이 즉시 반환
+            return []
+        results = self._check_ratio_sums(
+            share_data,
+            group_cols=["year_month"],
+            value_col="market_share_pct",
+            expected=100.0,
+            cfg_key="ratio_market_share",
+            check_name="시장 점유율 합계 = 100%",
+            default_tolerance=0.1,
+            default_severity="CRITICAL",
+        )
+        return self._record(results)
 
     # ──────────────────────────────────────────────────────
     # CHECK 3: 업종별 비율 합계 = 100% (카드사별)
@@ -425,33 +855,19 @@ class MetricsIntegrityChecker:
         self, category_data: List[Dict]
     ) -> List[IntegrityCheckResult]:
         """카드사별 업종 비율 합계 = 100% 검증"""
-        cfg = self._get_threshold("ratio_category")
-        results = []
-
-        groups: Dict[str, float] = defaultdict(float)
-        for row in category_data:
-            key = f"{row.get('year_month', '')}|{row.get('card_company', '')}"
-            groups[key] += float(row.get("category_share_pct", 0))
-
-        for key, total in sorted(groups.items()):
-            ym, company = key.split("|", 1)
-            diff = abs(100.0 - total)
-            tol = cfg.get("tolerance", 0.5)
-
-            results.append(IntegrityCheckResult(
-                check_name="업종별 비율 합계 = 100% (카드사별)",
-                check_category="ratio_integrity",
-                severity=cfg.get("severity", "WARNING"),
-                expected_value=100.0,
-                actual_value=round(total, 2),
-                difference=round(diff, 2),
-                tolerance=tol,
-                status=CheckStatus.PASS if diff < tol else CheckStatus.FAIL,
-                detail=f"year_month={ym}, company={company}",
-            ))
-
-        self.results.extend(results)
-        return results
+        if not category_data:  # 빈 입력 빠른 경로 — 할당 없이 즉시 반환
+            return []
+        results = self._check_ratio_sums(
+            category_data,
+            group_cols=["year_month", "card_company"],
+            value_col="category_share_pct",
+            expected=100.0,
+            cfg_key="ratio_category",
+            check_name="업종별 비율 합계 = 100% (카드사별)",
+            default_tolerance=0.5,
+            default_severity="WARNING",
+        )
+        return self._record(results)
 
     # ──────────────────────────────────────────────────────
     # CHECK 4: MoM 성장률 역산 검증
@@ -460,38 +876,51 @@ class MetricsIntegrityChecker:
         self, growth_data: List[Dict]
     ) -> List[IntegrityCheckResult]:
         """MoM 성장률로 전월 금액 역산 → 실제 전월 금액과 비교"""
+        if not growth_data:  # 빈 입력 빠른 경로 — 할당 없이 즉시 반환
+            return []
         cfg = self._get_threshold("formula_mom")
+        tol = cfg.get("tolerance", 10)
+        severity = cfg.get("severity", "WARNING")
         results = []
 
-        for row in growth_data:
-            mom = row.get("mom_growth_rate")
-            prev = row.get("prev_month_amount") or row.get("previous_amount")
-            curr = row.get("current_amount")
-
-            if mom is None or prev is None or curr is None:
-                continue
-            mom, prev, curr = float(mom), float(prev), float(curr)
-            if mom == 0:
-                continue
-
-            reverse_calc = round(curr / (1 + mom / 100.0), 0)
-            diff = abs(prev - reverse_calc)
-            tol = cfg.get("tolerance", 10)
-
-            results.append(IntegrityCheckResult(
-                check_name="MoM 성장률 역산 검증",
-                check_category="formula_integrity",
-                severity=cfg.get("severity", "WARNING"),
-                expected_value=prev,
-                actual_value=reverse_calc,
+        cols = self._soa(
+            growth_data,
+            ("mom_growth_rate", "prev_month_amount", "previous_amount", "current_amount"),
+        )
+        mom = cols["mom_growth_rate"]
+        prev = np.where(
+            np.isfinite(cols["prev_month_amount"]) & (cols["prev_month_amount"] != 0),
+            cols["prev_month_amount"],
+            cols["previous_amount"],
+        )
+        curr = cols["current_amount"]
+
+        mask = np.isfinite(mom) & np.isfinite(prev) & np.isfinite(curr) & (mom != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            reverse = np.round(curr / (1 + mom / 100.0), 0)
+        diffs = np.abs(prev - reverse)
+
+        yms = _str_column(growth_data, "year_month")
+        companies = _str_column(growth_data, "card_company")
+
+        make_result = partial(
+            IntegrityCheckResult,
+            check_name="MoM 성장률 역산 검증",
+            check_category="formula_integrity",
+            severity=severity,
+            tolerance=tol,
+        )
+        for i in np.nonzero(mask)[0]:
+            diff = float(diffs[i])
+            results.append(make_result(
+                expected_value=float(prev[i]),
+                actual_value=float(reverse[i]),
                 difference=round(diff, 2),
-                tolerance=tol,
                 status=CheckStatus.PASS if diff < tol else CheckStatus.FAIL,
-                detail=f"year_month={row.get('year_month', '')}, company={row.get('card_company', '')}",
+                detail="year_month=%s, company=%s" % (yms[i], companies[i]),
             ))
 
-        self.results.extend(results)
-        return results
+        return self._record(results)
 
     # ──────────────────────────────────────────────────────
     # CHECK 5: YoY 성장률 역산 검증
@@ -500,38 +929,44 @@ class MetricsIntegrityChecker:
         self, growth_data: List[Dict]
     ) -> List[IntegrityCheckResult]:
         """YoY 성장률로 전년 동월 금액 역산"""
+        if not growth_data:  # 빈 입력 빠른 경로 — 할당 없이 즉시 반환
+            return []
         cfg = self._get_threshold("formula_yoy")
+        tol = cfg.get("tolerance", 10)
+        severity = cfg.get("severity", "WARNING")
         results = []
 
-        for row in growth_data:
-            yoy = row.get("yoy_growth_rate")
-            prev_y = row.get("prev_year_amount")
-            curr = row.get("current_amount")
-
-            if yoy is None or prev_y is None or curr is None:
-                continue
-            yoy, prev_y, curr = float(yoy), float(prev_y), float(curr)
-            if yoy == 0:
-                continue
-
-            reverse_calc = round(curr / (1 + yoy / 100.0), 0)
-            diff = abs(prev_y - reverse_calc)
-            tol = cfg.get("tolerance", 10)
-
-            results.append(IntegrityCheckResult(
-                check_name="YoY 성장률 역산 검증",
-                check_category="formula_integrity",
-                severity=cfg.get("severity", "WARNING"),
-                expected_value=prev_y,
-                actual_value=reverse_calc,
+        cols = self._soa(growth_data, ("yoy_growth_rate", "prev_year_amount", "current_amount"))
+        yoy = cols["yoy_growth_rate"]
+        prev_y = cols["prev_year_amount"]
+        curr = cols["current_amount"]
+
+        mask = np.isfinite(yoy) & np.isfinite(prev_y) & np.isfinite(curr) & (yoy != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            reverse = np.round(curr / (1 + yoy / 100.0), 0)
+        diffs = np.abs(prev_y - reverse)
+
+        yms = _str_column(growth_data, "year_month")
+        companies = _str_column(growth_data, "card_company")
+
+        make_result = partial(
+            IntegrityCheckResult,
+            check_name="YoY 성장률 역산 검증",
+            check_category="formula_integrity",
+            severity=severity,
+            tolerance=tol,
+        )
+        for i in np.nonzero(mask)[0]:
+            diff = float(diffs[i])
+            results.append(make_result(
+                expected_value=float(prev_y[i]),
+                actual_value=float(reverse[i]),
                 difference=round(diff, 2),
-                tolerance=tol,
                 status=CheckStatus.PASS if diff < tol else CheckStatus.FAIL,
-                detail=f"year_month={row.get('year_month', '')}, company={row.get('card_company', '')}",
+                detail="year_month=%s, company=%s" % (yms[i], companies[i]),
             ))
 
-        self.results.extend(results)
-        return results
+        return self._record(results)
 
     # ──────────────────────────────────────────────────────
     # CHECK 6: 활성화율 범위 검증
@@ -540,28 +975,38 @@ class MetricsIntegrityChecker:
         self, activation_data: List[Dict]
     ) -> List[IntegrityCheckResult]:
         """활성화율 0~100% 범위 검증"""
+        if not activation_data:  # 빈 입력 빠른 경로 — 할당 없이 즉시 반환
+            return []
         cfg = self._get_threshold("range_activation")
         results = []
         lo, hi = cfg.get("min", 0), cfg.get("max", 100)
-
-        for row in activation_data:
-            rate = float(row.get("activation_rate", 0))
-            in_range = lo <= rate <= hi
-
-            results.append(IntegrityCheckResult(
-                check_name="활성화율 범위 검증 (0~100%)",
-                check_category="range_integrity",
-                severity=cfg.get("severity", "CRITICAL"),
-                expected_value=hi,
-                actual_value=rate,
-                difference=0 if in_range else abs(rate - (hi if rate > hi else lo)),
-                tolerance=0,
-                status=CheckStatus.PASS if in_range else CheckStatus.FAIL,
-                detail=f"year_month={row.get('year_month', '')}, company={row.get('card_company', '')}",
+        severity = cfg.get("severity", "CRITICAL")
+
+        rates = np.nan_to_num(self._soa(activation_data, ("activation_rate",))["activation_rate"])
+        in_range = (rates >= lo) & (rates <= hi)
+        overshoot = np.abs(rates - np.where(rates > hi, hi, lo))
+
+        yms = _str_column(activation_data, "year_month")
+        companies = _str_column(activation_data, "card_company")
+
+        make_result = partial(
+            IntegrityCheckResult,
+            check_name="활성화율 범위 검증 (0~100%)",
+            check_category="range_integrity",
+            severity=severity,
+            expected_value=hi,
+            tolerance=0,
+        )
+        for i, rate in enumerate(rates):
+            ok = bool(in_range[i])
+            results.append(make_result(
+                actual_value=float(rate),
+                difference=0 if ok else float(overshoot[i]),
+                status=CheckStatus.PASS if ok else CheckStatus.FAIL,
+                detail="year_month=%s, company=%s" % (yms[i], companies[i]),
             ))
 
-        self.results.extend(results)
-        return results
+        return self._record(results)
 
     # ──────────────────────────────────────────────────────
     # CHECK 7: 데이터 연속성 (월 누락)
@@ -570,45 +1015,53 @@ class MetricsIntegrityChecker:
         self, monthly_data: List[Dict]
     ) -> List[IntegrityCheckResult]:
         """카드사별 연속 월 데이터 누락 검사"""
+        if len(monthly_data) < 2:  # 빈/단일 행 입력 빠른 경로
+            return []
         cfg = self._get_threshold("continuity")
+        max_missing = cfg.get("max_missing_months", 0)
+        severity = cfg.get("severity", "CRITICAL")
         results = []
 
-        company_months: Dict[str, set] = defaultdict(set)
-        for row in monthly_data:
-            company_months[row.get("card_company", "")].add(
-                str(row.get("year_month", ""))
-            )
-
-        for company, months in sorted(company_months.items()):
-            sorted_m = sorted(months)
-            if len(sorted_m) < 2:
+        df = _as_dataframe(monthly_data, ("card_company", "year_month"))
+        if df.empty:
+            self.results.extend(results)
+            return results
+
+        df["card_company"] = df["card_company"].fillna("").astype(str)
+        # strptime 파싱 대신 월 단위 Period(연속 정수)로 변환해
+        # 기대 월 수를 벡터화된 산술로 산출
+        periods = pd.to_datetime(
+            df["year_month"].astype(str).str[:7], format="%Y-%m", errors="coerce"
+        ).dt.to_period("M")
+        grouped = df.assign(period=periods).groupby("card_company")["period"]
+        firsts, lasts, actuals = grouped.min(), grouped.max(), grouped.nunique()
+
+        for company in sorted(actuals.index):
+            actual = int(actuals[company])
+            if actual < 2:
                 continue
 
-            # YYYY-MM 형식 파싱해서 기대 월 수 산출
-            try:
-                first = datetime.strptime(sorted_m[0][:7], "%Y-%m")
-                last = datetime.strptime(sorted_m[-1][:7], "%Y-%m")
-                expected = (last.year - first.year) * 12 + (last.month - first.month) + 1
-            except (ValueError, IndexError):
-                expected = len(sorted_m)
+            first, last = firsts[company], lasts[company]
+            if pd.isna(first) or pd.isna(last):
+                expected = actual  # 파싱 불가 형식 — 관측 월 수를 기대치로 사용
+            else:
+                expected = int(last.ordinal - first.ordinal) + 1
 
-            actual = len(sorted_m)
             missing = expected - actual
 
             results.append(IntegrityCheckResult(
                 check_name="데이터 연속성 검증 (월 누락)",
                 check_category="continuity_integrity",
-                severity=cfg.get("severity", "CRITICAL"),
+                severity=severity,
                 expected_value=expected,
                 actual_value=actual,
                 difference=missing,
-                tolerance=cfg.get("max_missing_months", 0),
-                status=CheckStatus.PASS if missing <= cfg.get("max_missing_months", 0) else CheckStatus.FAIL,
-                detail=f"company={company}, months={actual}/{expected}",
+                tolerance=max_missing,
+                status=CheckStatus.PASS if missing <= max_missing else CheckStatus.FAIL,
+                detail="company=%s, months=%d/%d" % (company, actual, expected),
             ))
 
-        self.results.extend(results)
-        return results
+        return self._record(results)
 
     # ──────────────────────────────────────────────────────
     # CHECK 8: Z-Score 이상치 탐지
@@ -617,6 +1070,8 @@ class MetricsIntegrityChecker:
         self, usage_data: List[Dict]
     ) -> List[IntegrityCheckResult]:
         """카드사별 이용금액 Z-Score 산출 및 이상치 비율 검증"""
+        if not usage_data:  # 빈 입력 빠른 경로 — 할당 없이 즉시 반환
+            return []
         cfg = self._get_threshold("statistical_anomaly")
         results = []
 
@@ -628,32 +1083,24 @@ class MetricsIntegrityChecker:
             )
 
         z_critical = cfg.get("z_score_critical", 3.0)
-        z_warning = cfg.get("z_score_warning", 2.0)
-        all_z_scores = []
+        total_scored = 0
+        critical_count = 0
 
         for company, records in sorted(company_amounts.items()):
-            values = [r[1] for r in records]
-            if len(values) < 3:
+            if len(records) < 3:
                 continue
 
-            for ym, val in records:
-                z = calc_z_score(val, values)
-                if z is None:
-                    continue
-
-                abs_z = abs(z)
-                if abs_z > z_critical:
-                    level = Severity.CRITICAL
-                elif abs_z > z_warning:
-                    level = Severity.WARNING
-                else:
-                    level = Severity.INFO
+            # 값마다 mean/pstdev를 재계산하던 O(n²) 루프 대신
+            # 회사별 Z-Score 전체를 배치 헬퍼 한 번으로 산출
+            # 박싱된 float 리스트 대신 연속 float64 버퍼로 바로 채움
+            values = np.fromiter((r[1] for r in records), dtype=np.float64, count=len(records))
+            z_scores = calc_z_scores_batch(values)
 
-                all_z_scores.append((company, ym, z, level))
+            # 임계값 버킷 분류는 파이썬 비교 N회 대신 마스크 집계 한 번으로
+            total_scored += len(z_scores)
+            critical_count += int((np.abs(z_scores) > z_critical).sum())
 
-        # 개별 이상치 리포팅
-        critical_count = sum(1 for _, _, _, lvl in all_z_scores if lvl == Severity.CRITICAL)
-        total_count = len(all_z_scores) or 1
+        total_count = total_scored or 1
         critical_ratio = round(critical_count / total_count * 100, 2)
         max_ratio = cfg.get("max_critical_ratio", 5.0)
 
@@ -671,9 +1118,9 @@ class MetricsIntegrityChecker:
 
         # IQR 기반 보조 검증
         for company, records in sorted(company_amounts.items()):
-            values = [r[1] for r in records]
-            if len(values) < 4:
+            if len(records) < 4:
                 continue
+            values = np.fromiter((r[1] for r in records), dtype=np.float64, count=len(records))
             lower, upper = calc_iqr_bounds(values)
             outliers = [(ym, v) for ym, v in records if v < lower or v > upper]
             for ym, v in outliers:
@@ -686,11 +1133,10 @@ class MetricsIntegrityChecker:
                     difference=round(abs(v - upper) if v > upper else abs(lower - v), 2),
                     tolerance=0,
                     status=CheckStatus.FAIL,
-                    detail=f"company={company}, year_month={ym}, bounds=[{lower:.0f}, {upper:.0f}]",
+                    detail="company=%s, year_month=%s, bounds=[%.0f, %.0f]" % (company, ym, lower, upper),
                 ))
 
-        self.results.extend(results)
-        return results
+        return self._record(results)
 
     # ──────────────────────────────────────────────────────
     # CHECK 9: 추세 급변 탐지 (Trend Break Detection)
@@ -699,6 +1145,8 @@ class MetricsIntegrityChecker:
         self, usage_data: List[Dict]
     ) -> List[IntegrityCheckResult]:
         """카드사별 이용금액 추세 급변 구간 탐지"""
+        if not usage_data:  # 빈 입력 빠른 경로 — 할당 없이 즉시 반환
+            return []
         results = []
 
         company_series: Dict[str, List[tuple]] = defaultdict(list)
@@ -709,25 +1157,26 @@ class MetricsIntegrityChecker:
 
         for company, records in sorted(company_series.items()):
             records.sort(key=lambda x: x[0])
-            values = [r[1] for r in records]
+            values = np.fromiter((r[1] for r in records), dtype=np.float64, count=len(records))
             breaks = detect_trend_break(values, window=3, threshold_sigma=2.0)
 
             for idx in breaks:
                 ym = records[idx][0]
+                window = values[max(0, idx - 3):idx]
+                window_mean = float(window.mean())
                 results.append(IntegrityCheckResult(
                     check_name="추세 급변 탐지 (Trend Break)",
                     check_category="trend_integrity",
                     severity="WARNING",
-                    expected_value=round(statistics.mean(values[max(0, idx-3):idx]), 2),
-                    actual_value=round(values[idx], 2),
-                    difference=round(abs(values[idx] - statistics.mean(values[max(0, idx-3):idx])), 2),
+                    expected_value=round(window_mean, 2),
+                    actual_value=round(float(values[idx]), 2),
+                    difference=round(abs(float(values[idx]) - window_mean), 2),
                     tolerance=0,
                     status=CheckStatus.FAIL,
-                    detail=f"company={company}, year_month={ym}",
+                    detail="company=%s, year_month=%s" % (company, ym),
                 ))
 
-        self.results.extend(results)
-        return results
+        return self._record(results)
 
     # ──────────────────────────────────────────────────────
     # CHECK 10: 점유율 ↔ 성장률 교차 검증
@@ -736,16 +1185,31 @@ class MetricsIntegrityChecker:
         self, share_data: List[Dict], growth_data: List[Dict]
     ) -> List[IntegrityCheckResult]:
         """점유율 변동 방향과 성장률 부호 교차 검증"""
+        if not share_data or not growth_data:  # 빈 입력 빠른 경로
+            return []
         cfg = self._get_threshold("cross_kpi")
+        share_thr = cfg.get("share_change_threshold", 0.5)
+        growth_thr = cfg.get("growth_rate_threshold", -1.0)
+        severity = cfg.get("severity", "INFO")
         results = []
 
-        share_map = {}
+        # 튜플 키는 "ym|company" 문자열 결합·분리 비용이 없고,
+        # 회사명에 구분자가 들어가는 경우의 오동작도 원천 차단
+        share_map: Dict[tuple, float] = {}
         for row in share_data:
-            key = f"{row.get('year_month', '')}|{row.get('card_company', '')}"
+            key = (str(row.get("year_month", "")), str(row.get("card_company", "")))
             share_map[key] = float(row.get("share_change_pp", 0))
 
+        make_result = partial(
+            IntegrityCheckResult,
+            check_name="점유율 변동 ↔ 성장률 교차 검증",
+            check_category="cross_kpi_integrity",
+            severity=severity,
+            expected_value=0,
+            tolerance=0,
+        )
         for row in growth_data:
-            key = f"{row.get('year_month', '')}|{row.get('card_company', '')}"
+            key = (str(row.get("year_month", "")), str(row.get("card_company", "")))
             share_chg = share_map.get(key)
             mom = row.get("mom_growth_rate")
             if share_chg is None or mom is None:
@@ -753,32 +1217,64 @@ class MetricsIntegrityChecker:
             mom = float(mom)
 
             # 점유율 증가(+0.5pp 초과)인데 성장률이 마이너스(-1% 미만)이면 불일치
-            share_thr = cfg.get("share_change_threshold", 0.5)
-            growth_thr = cfg.get("growth_rate_threshold", -1.0)
             inconsistent = share_chg > share_thr and mom < growth_thr
 
-            results.append(IntegrityCheckResult(
-                check_name="점유율 변동 ↔ 성장률 교차 검증",
-                check_category="cross_kpi_integrity",
-                severity=cfg.get("severity", "INFO"),
-                expected_value=0,
+            results.append(make_result(
                 actual_value=1 if inconsistent else 0,
                 difference=1 if inconsistent else 0,
-                tolerance=0,
                 status=CheckStatus.FAIL if inconsistent else CheckStatus.PASS,
-                detail=f"year_month={row.get('year_month', '')}, company={row.get('card_company', '')}, "
-                       f"share_chg={share_chg:+.2f}pp, mom={mom:+.2f}%",
+                detail="year_month=%s, company=%s, share_chg=%+.2fpp, mom=%+.2f%%"
+                       % (row.get("year_month", ""), row.get("card_company", ""), share_chg, mom),
             ))
 
-        self.results.extend(results)
-        return results
+        return self._record(results)
+
+    # ══════════════════════════════════════════════════════
+    # 일괄 실행
+    # ══════════════════════════════════════════════════════
+
+    def run_all(self, data: Dict[str, Any]) -> List[IntegrityCheckResult]:
+        """10종 검증을 스레드 풀로 병렬 실행
+
+        각 검증은 서로 독립적이고 NumPy/pandas 구간에서 GIL을 해제하므로
+        스레드 병렬화가 유효합니다. list.extend는 GIL 하에서 원자적이라
+        별도 락 없이 안전하며, 완료 순서에 따라 뒤섞인 결과는 제출 순서
+        기준으로 재배열해 리포트 출력을 결정적으로 유지합니다.
+        """
+        jobs = [
+            (self.check_sum_integrity, (data["usage"],)),
+            (self.check_market_share_integrity, (data["share"],)),
+            (self.check_category_ratio_integrity, (data["category"],)),
+            (self.check_formula_mom, (data["growth"],)),
+            (self.check_formula_yoy, (data["growth"],)),
+            (self.check_range_activation, (data["activation"],)),
+            (self.check_continuity, (data["monthly_usage"],)),
+            (self.check_statistical_anomaly, (data["monthly_usage"],)),
+            (self.check_trend_breaks, (data["monthly_usage"],)),
+            (self.check_cross_kpi_consistency, (data["share"], data["growth"])),
+        ]
+
+        prior = len(self.results)
+        with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 4)) as executor:
+            futures = [executor.submit(fn, *args) for fn, args in jobs]
+            ordered = [f.result() for f in futures]
+
+        self.results[prior:] = [r for results in ordered for r in results]
+        self._summary_cache = None
+        return self.results
 
     # ══════════════════════════════════════════════════════
     # 결과 집계 & 리포트
     # ══════════════════════════════════════════════════════
 
     def get_summary(self) -> Dict[str, Any]:
-        """검증 결과 요약"""
+        """검증 결과 요약 — 결과가 바뀌지 않는 한 캐시 재사용
+
+        print_report / 각 exporter / CLI 종료 코드 판정이 연달아 호출하므로
+        결과 목록 순회를 한 번으로 줄입니다.
+        """
+        if self._summary_cache is not None:
+            return self._summary_cache
         total = len(self.results)
         passed = sum(1 for r in self.results if r.is_passed)
         failed = total - passed
@@ -797,7 +1293,7 @@ class MetricsIntegrityChecker:
                 by_category[cat]["passed"] / max(by_category[cat]["total"], 1) * 100, 1
             )
 
-        return {
+        self._summary_cache = {
             "check_date": self.check_date.isoformat(),
             "total_checks": total,
             "passed": passed,
@@ -806,24 +1302,21 @@ class MetricsIntegrityChecker:
             "overall_pass_rate": round(passed / max(total, 1) * 100, 1),
             "overall_status": "PASS" if failed == 0 else ("CRITICAL" if critical_fails > 0 else "WARNING"),
             "by_category": by_category,
-            "failed_checks": [asdict(r) for r in self.results if not r.is_passed],
+            "failed_checks": [r.to_dict() for r in self.results if not r.is_passed],
         }
+        return self._summary_cache
 
     def export_to_csv(self, output_dir: str) -> str:
         """CSV 리포트 내보내기"""
         os.makedirs(output_dir, exist_ok=True)
         filepath = os.path.join(output_dir, f"integrity_report_{self.check_date}.csv")
 
-        fieldnames = [
-            "check_name", "check_category", "severity",
-            "expected_value", "actual_value", "difference",
-            "tolerance", "status", "detail", "timestamp",
-        ]
-        with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for r in self.results:
-                writer.writerow(asdict(r))
+        import csv  # 내보내기 시에만 로드
+
+        with open(filepath, "w", newline="", encoding="utf-8-sig", buffering=65536) as f:
+            writer = csv.writer(f)
+            writer.writerow(_CSV_FIELDNAMES)
+            writer.writerows(r._as_tuple() for r in self.results)
 
         logger.info("CSV 저장: %s (%d건)", filepath, len(self.results))
         return filepath
@@ -833,11 +1326,22 @@ class MetricsIntegrityChecker:
         os.makedirs(output_dir, exist_ok=True)
         filepath = os.path.join(output_dir, f"integrity_report_{self.check_date}.json")
 
-        report = self.get_summary()
-        report["all_checks"] = [asdict(r) for r in self.results]
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+        # 캐시된 요약 dict를 오염시키지 않도록 얕은 복사 후 확장
+        report = dict(self.get_summary())
+
+        if orjson is not None:
+            # orjson은 dataclass를 네이티브 직렬화하므로 asdict 변환이 불필요
+            report["all_checks"] = self.results
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(
+                    report,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                ))
+        else:
+            report["all_checks"] = [r.to_dict() for r in self.results]
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=str)
 
         logger.info("JSON 저장: %s", filepath)
         return filepath
@@ -854,89 +1358,13 @@ class MetricsIntegrityChecker:
         }
         overall_color = status_color.get(summary["overall_status"], "#6b7280")
 
-        # 카테고리별 테이블 행
-        cat_rows = ""
-        for cat, stats in summary["by_category"].items():
-            icon = "" if stats["failed"] == 0 else ""
-            cat_rows += f"""
-            <tr>
-                <td>{icon} {cat}</td>
-                <td class="num">{stats['total']}</td>
-                <td class="num pass">{stats['passed']}</td>
-                <td class="num fail">{stats['failed']}</td>
-                <td class="num">{stats['pass_rate']}%</td>
-            </tr>"""
-
-        # 실패 항목 행
-        fail_rows = ""
-        for r in self.results:
-            if r.is_passed:
-                continue
-            sev_cls = r.severity.lower()
-            fail_rows += f"""
-            <tr class="{sev_cls}">
-                <td><span class="badge {sev_cls}">{r.severity}</span></td>
-                <td>{r.check_name}</td>
-                <td class="num">{r.expected_value}</td>
-                <td class="num">{r.actual_value}</td>
-                <td class="num">{r.difference}</td>
-                <td>{r.detail}</td>
-            </tr>"""
-
-        # 전체 결과 행
-        all_rows = ""
-        for r in self.results:
-            cls = "pass-row" if r.is_passed else "fail-row"
-            all_rows += f"""
-            <tr class="{cls}">
-                <td>{r.status}</td>
-                <td>{r.check_name}</td>
-                <td>{r.check_category}</td>
-                <td><span class="badge {r.severity.lower()}">{r.severity}</span></td>
-                <td class="num">{r.expected_value}</td>
-                <td class="num">{r.actual_value}</td>
-                <td class="num">{r.difference}</td>
-                <td>{r.detail}</td>
-            </tr>"""
+        # 문서 전체를 하나의 거대 문자열로 만들지 않고 64KB 버퍼로
+        # 스트리밍 기록 — 피크 메모리가 행 수와 무관하게 O(1)
+        failed = [r for r in self.results if not r.is_passed]
 
-        html = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>지표 정합성 검증 리포트 — {self.check_date}</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, 'Pretendard', sans-serif; background: #f8fafc; color: #1e293b; padding: 2rem; }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        h1 {{ font-size: 1.5rem; margin-bottom: 0.25rem; }}
-        .subtitle {{ color: #64748b; margin-bottom: 2rem; }}
-
-        .kpi-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 1rem; margin-bottom: 2rem; }}
-        .kpi-card {{ background: white; border-radius: 12px; padding: 1.25rem; box-shadow: 0 1px 3px rgba(0,0,0,.08); }}
-        .kpi-label {{ font-size: 0.8rem; color: #64748b; margin-bottom: 4px; }}
-        .kpi-value {{ font-size: 1.75rem; font-weight: 700; }}
-        .kpi-value.pass {{ color: #10b981; }}
-        .kpi-value.fail {{ color: #ef4444; }}
-
-        table {{ width: 100%; border-collapse: collapse; background: white; border-radius: 12px; overflow: hidden; box-shadow: 0 1px 3px rgba(0,0,0,.08); margin-bottom: 2rem; }}
-        th {{ background: #f1f5f9; text-align: left; padding: 0.75rem 1rem; font-size: 0.8rem; color: #475569; text-transform: uppercase; letter-spacing: 0.05em; }}
-        td {{ padding: 0.65rem 1rem; border-top: 1px solid #f1f5f9; font-size: 0.875rem; }}
-        .num {{ text-align: right; font-variant-numeric: tabular-nums; }}
-        .pass {{ color: #10b981; }}
-        .fail {{ color: #ef4444; }}
-        .pass-row {{ background: #f0fdf4; }}
-        .fail-row {{ background: #fef2f2; }}
-
-        .badge {{ display: inline-block; padding: 2px 8px; border-radius: 6px; font-size: 0.7rem; font-weight: 600; }}
-        .badge.critical {{ background: #fee2e2; color: #dc2626; }}
-        .badge.warning {{ background: #fef3c7; color: #d97706; }}
-        .badge.info {{ background: #dbeafe; color: #2563eb; }}
-
-        .section-title {{ font-size: 1.1rem; font-weight: 600; margin: 1.5rem 0 0.75rem; }}
-        details {{ margin-bottom: 2rem; }}
-        summary {{ cursor: pointer; font-weight: 600; padding: 0.5rem 0; }}
-    </style>
+        with open(filepath, "wb", buffering=65536) as f:
+            f.write(_HTML_HEAD_B)
+            f.write(f"""    <title>지표 정합성 검증 리포트 — {self.check_date}</title>
 </head>
 <body>
 <div class="container">
@@ -969,28 +1397,67 @@ class MetricsIntegrityChecker:
     <div class="section-title">카테고리별 요약</div>
     <table>
         <thead><tr><th>카테고리</th><th>전체</th><th>통과</th><th>실패</th><th>통과율</th></tr></thead>
-        <tbody>{cat_rows}</tbody>
-    </table>
+        <tbody>""".encode("utf-8"))
 
-    {"<div class='section-title'>실패 항목 상세</div><table><thead><tr><th>심각도</th><th>검증 항목</th><th>기대값</th><th>실제값</th><th>차이</th><th>상세</th></tr></thead><tbody>" + fail_rows + "</tbody></table>" if fail_rows else ""}
+            for cat, stats in summary["by_category"].items():
+                icon = "" if stats["failed"] == 0 else ""
+                f.write(f"""
+            <tr>
+                <td>{icon} {cat}</td>
+                <td class="num">{stats['total']}</td>
+                <td class="num pass">{stats['passed']}</td>
+                <td class="num fail">{stats['failed']}</td>
+                <td class="num">{stats['pass_rate']}%</td>
+            </tr>""".encode("utf-8"))
+
+            f.write(b"</tbody>\n    </table>\n")
+
+            if failed:
+                f.write(("\n    <div class='section-title'>실패 항목 상세</div>"
+                         "<table><thead><tr><th>심각도</th><th>검증 항목</th><th>기대값</th>"
+                         "<th>실제값</th><th>차이</th><th>상세</th></tr></thead><tbody>").encode("utf-8"))
+                for r in failed:
+                    sev_cls = r.severity.lower()
+                    f.write(f"""
+            <tr class="{sev_cls}">
+                <td><span class="badge {sev_cls}">{r.severity}</span></td>
+                <td>{r.check_name}</td>
+                <td class="num">{r.expected_value}</td>
+                <td class="num">{r.actual_value}</td>
+                <td class="num">{r.difference}</td>
+                <td>{r.detail}</td>
+            </tr>""".encode("utf-8"))
+                f.write(b"</tbody></table>\n")
 
+            f.write(f"""
     <details>
         <summary>전체 검증 결과 ({summary['total_checks']}건)</summary>
         <table>
             <thead><tr><th>상태</th><th>검증 항목</th><th>카테고리</th><th>심각도</th><th>기대값</th><th>실제값</th><th>차이</th><th>상세</th></tr></thead>
-            <tbody>{all_rows}</tbody>
+            <tbody>""".encode("utf-8"))
+
+            for r in self.results:
+                cls = "pass-row" if r.is_passed else "fail-row"
+                f.write(f"""
+            <tr class="{cls}">
+                <td>{r.status}</td>
+                <td>{r.check_name}</td>
+                <td>{r.check_category}</td>
+                <td><span class="badge {r.severity.lower()}">{r.severity}</span></td>
+                <td class="num">{r.expected_value}</td>
+                <td class="num">{r.actual_value}</td>
+                <td class="num">{r.difference}</td>
+                <td>{r.detail}</td>
+            </tr>""".encode("utf-8"))
+
+            f.write(f"""</tbody>
         </table>
     </details>
 
     <p style="color:#94a3b8; font-size:0.75rem; margin-top:2rem;">
         Generated by metrics-quality-dashboard · {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-    </p>
-</div>
-</body>
-</html>"""
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(html)
+    </p>""".encode("utf-8"))
+            f.write(_HTML_FOOT_B)
 
         logger.info("HTML 저장: %s", filepath)
         return filepath
@@ -1038,11 +1505,11 @@ class MetricsIntegrityChecker:
 
 def generate_demo_data() -> Dict[str, List[Dict]]:
     """데모용 24개월 × 8개 카드사 데이터 생성"""
-    import random
-    random.seed(42)
+    rng = np.random.default_rng(42)
 
-    companies = ["신한카드", "삼성카드", "KB국민카드", "현대카드", "우리카드", "하나카드", "롯데카드", "BC카드"]
-    categories = ["음식점", "주유소", "대형마트", "온라인쇼핑", "교통", "의료", "교육", "여행/숙박"]
+    # 불변 목록은 튜플로 — 반복 순회 시 이터레이터 생성 외 할당이 없음
+    companies = ("신한카드", "삼성카드", "KB국민카드", "현대카드", "우리카드", "하나카드", "롯데카드", "BC카드")
+    categories = ("음식점", "주유소", "대형마트", "온라인쇼핑", "교통", "의료", "교육", "여행/숙박")
 
     # 카드사별 기본 규모 (억원)
     base_amounts = {
@@ -1050,117 +1517,107 @@ def generate_demo_data() -> Dict[str, List[Dict]]:
         "우리카드": 8000, "하나카드": 7500, "롯데카드": 6500, "BC카드": 5500,
     }
 
+    # 수치 생성은 전부 (24개월 × 8개사) 배열 연산으로 일괄 수행하고,
+    # dict 행은 마지막에 내보내기 경계에서만 생성
+    years = np.repeat([2024, 2025], 12)                     # (24,)
+    months = np.tile(np.arange(1, 13), 2)                   # (24,)
+    ym_list = [f"{y}-{m:02d}-01" for y, m in zip(years, months)]
+    base = np.array([base_amounts[c] for c in companies], dtype=np.float64)
+
+    trend = 1 + (years - 2024) * 0.03 + months * 0.002      # 완만 성장 트렌드
+    seasonal = 0.03 * np.sin(2 * np.pi * months / 12)       # 계절성
+    noise = rng.uniform(-0.05, 0.05, size=(len(ym_list), len(companies)))
+    amounts = np.rint(
+        base[None, :] * trend[:, None] * (1 + noise + seasonal[:, None])
+    ).astype(np.int64)
+
     usage_data = []
     monthly_usage = []
     category_data = []
 
-    for year in (2024, 2025):
-        for month in range(1, 13):
-            ym = f"{year}-{month:02d}-01"
-            trend = 1 + (year - 2024) * 0.03 + month * 0.002  # 완만 성장 트렌드
-
-            for company in companies:
-                base = base_amounts[company]
-                noise = random.uniform(-0.05, 0.05)
-                seasonal = 0.03 * math.sin(2 * math.pi * month / 12)  # 계절성
-                amount = round(base * trend * (1 + noise + seasonal))
-
-                usage_data.append({
-                    "year_month": ym,
-                    "card_company": company,
-                    "usage_amount": amount,
-                })
-
-            # 월별 집계
-            month_total = sum(r["usage_amount"] for r in usage_data if r["year_month"] == ym)
-            for company in companies:
-                comp_amount = sum(
-                    r["usage_amount"]
-                    for r in usage_data
-                    if r["year_month"] == ym and r["card_company"] == company
-                )
-                monthly_usage.append({
-                    "year_month": ym,
-                    "card_company": company,
-                    "total_usage_amount": comp_amount,
-                })
+    for mi, ym in enumerate(ym_list):
+        for ci, company in enumerate(companies):
+            amount = int(amounts[mi, ci])
+            usage_data.append({
+                "year_month": ym,
+                "card_company": company,
+                "usage_amount": amount,
+            })
+            # (ym, company) 조합당 이용 행이 하나이므로 합계 = amount
+            monthly_usage.append({
+                "year_month": ym,
+                "card_company": company,
+                "total_usage_amount": amount,
+            })
+
+    # 점유율 데이터 — (24, 8) 배열에서 점유율과 전월 대비 변동을 일괄 계산
+    shares = np.round(amounts / amounts.sum(axis=1, keepdims=True) * 100, 2)
+    # prepend로 첫 행을 자기 자신과 비교해 첫 달 변동은 0
+    share_change = np.round(np.diff(shares, axis=0, prepend=shares[:1]), 2)
 
-    # 점유율 데이터
     share_data = []
-    months_map: Dict[str, float] = defaultdict(float)
-    for row in monthly_usage:
-        months_map[row["year_month"]] += row["total_usage_amount"]
-
-    prev_shares: Dict[str, float] = {}
-    for row in monthly_usage:
-        ym = row["year_month"]
-        company = row["card_company"]
-        share = round(row["total_usage_amount"] / months_map[ym] * 100, 2)
-        prev = prev_shares.get(company, share)
-        share_data.append({
-            "year_month": ym,
-            "card_company": company,
-            "market_share_pct": share,
-            "share_change_pp": round(share - prev, 2),
-        })
-        prev_shares[company] = share
-
-    # 성장률 데이터
+    for mi, ym in enumerate(ym_list):
+        for ci, company in enumerate(companies):
+            share_data.append({
+                "year_month": ym,
+                "card_company": company,
+                "market_share_pct": float(shares[mi, ci]),
+                "share_change_pp": float(share_change[mi, ci]),
+            })
+
+    # 성장률 데이터 — amounts (24, 8) 배열 행 시프트로 MoM/YoY 일괄 계산
+    amounts_f = amounts.astype(np.float64)
+    mom_rates = np.empty_like(amounts_f)
+    mom_rates[1:] = np.round((amounts_f[1:] - amounts_f[:-1]) / amounts_f[:-1] * 100, 2)
+    yoy_rates = np.empty_like(amounts_f)
+    yoy_rates[12:] = np.round((amounts_f[12:] - amounts_f[:12]) / amounts_f[:12] * 100, 2)
+
     growth_data = []
-    prev_amounts: Dict[str, float] = {}
-    prev_year_amounts: Dict[str, Dict[str, float]] = defaultdict(dict)
-
-    for row in sorted(monthly_usage, key=lambda x: x["year_month"]):
-        company = row["card_company"]
-        ym = row["year_month"]
-        curr = row["total_usage_amount"]
-        prev = prev_amounts.get(company)
-        # YoY: 12개월 전
-        ym_parts = ym.split("-")
-        prev_y_key = f"{int(ym_parts[0]) - 1}-{ym_parts[1]}-{ym_parts[2]}"
-        prev_y = prev_year_amounts.get(company, {}).get(prev_y_key)
-
-        mom = round((curr - prev) / prev * 100, 2) if prev and prev != 0 else None
-        yoy = round((curr - prev_y) / prev_y * 100, 2) if prev_y and prev_y != 0 else None
-
-        growth_data.append({
-            "year_month": ym,
-            "card_company": company,
-            "current_amount": curr,
-            "prev_month_amount": prev,
-            "prev_year_amount": prev_y,
-            "mom_growth_rate": mom,
-            "yoy_growth_rate": yoy,
-        })
-
-        prev_amounts[company] = curr
-        prev_year_amounts[company][ym] = curr
-
-    # 활성화율 데이터
+    for mi, ym in enumerate(ym_list):
+        for ci, company in enumerate(companies):
+            growth_data.append({
+                "year_month": ym,
+                "card_company": company,
+                "current_amount": int(amounts[mi, ci]),
+                "prev_month_amount": int(amounts[mi - 1, ci]) if mi >= 1 else None,
+                "prev_year_amount": int(amounts[mi - 12, ci]) if mi >= 12 else None,
+                "mom_growth_rate": float(mom_rates[mi, ci]) if mi >= 1 else None,
+                "yoy_growth_rate": float(yoy_rates[mi, ci]) if mi >= 12 else None,
+            })
+
+    # 활성화율 데이터 — 회사×월 전체를 한 번에 샘플링 후 클리핑
+    base_rates = rng.uniform(62, 78, size=len(companies))
+    act_rates = np.clip(
+        np.round(
+            base_rates[:, None]
+            + rng.uniform(-2, 2, size=(len(companies), len(ym_list)))
+            + (years[None, :] - 2024) * 1.5,
+            2,
+        ),
+        0, 100,
+    )
     activation_data = []
-    for company in companies:
-        base_rate = random.uniform(62, 78)
-        for year in (2024, 2025):
-            for month in range(1, 13):
-                ym = f"{year}-{month:02d}-01"
-                rate = round(base_rate + random.uniform(-2, 2) + (year - 2024) * 1.5, 2)
-                rate = max(0, min(100, rate))  # 범위 보장
-                activation_data.append({
-                    "year_month": ym,
-                    "card_company": company,
-                    "activation_rate": rate,
-                })
-
-    # 업종별 비율 데이터
+    for ci, company in enumerate(companies):
+        for mi, ym in enumerate(ym_list):
+            activation_data.append({
+                "year_month": ym,
+                "card_company": company,
+                "activation_rate": float(act_rates[ci, mi]),
+            })
+
+    # 업종별 비율 데이터 — 노이즈는 일괄 샘플링, 잔여분 보정만 루프에서 수행
     cat_weights = [0.22, 0.12, 0.15, 0.18, 0.10, 0.08, 0.07, 0.08]
-    for row in monthly_usage:
-        remainder = 100.0
+    cat_noise = rng.uniform(-2, 2, size=(len(monthly_usage), len(categories) - 1))
+    # 마지막 업종을 제외한 비율을 일괄 반올림하고 잔여분은 열 합계로 역산
+    cat_pct = np.round(np.array(cat_weights[:-1]) * 100 + cat_noise, 2)
+    cat_last = np.round(100.0 - cat_pct.sum(axis=1), 2)
+    last_cat_idx = len(categories) - 1  # 내부 루프의 len() 재계산 제거
+    for ri, row in enumerate(monthly_usage):
         for i, cat in enumerate(categories):
-            if i == len(categories) - 1:
-                pct = round(remainder, 2)
+            if i == last_cat_idx:
+                pct = float(cat_last[ri])
             else:
-                pct = round(cat_weights[i] * 100 + random.uniform(-2, 2), 2)
-                remainder -= pct
+                pct = float(cat_pct[ri, i])
             category_data.append({
                 "year_month": row["year_month"],
                 "card_company": row["card_company"],
@@ -1206,6 +1663,9 @@ def main():
     config = load_config(args.config)
     checker = MetricsIntegrityChecker(config=config)
 
+    # 설정 등 장수 객체를 영구 세대로 옮겨 이후 GC 스캔 대상에서 제외
+    gc.freeze()
+
     logger.info("지표 정합성 검증 시작")
 
     # 데모 데이터 생성 (DB 연결 없는 경우)
@@ -1213,27 +1673,32 @@ def main():
     logger.info("데모 데이터 생성 완료: %d건 이용내역, %d개 카드사",
                 len(demo["usage"]), 8)
 
-    # ── 10종 검증 실행 ──
-    checker.check_sum_integrity(demo["usage"])
-    checker.check_market_share_integrity(demo["share"])
-    checker.check_category_ratio_integrity(demo["category"])
-    checker.check_formula_mom(demo["growth"])
-    checker.check_formula_yoy(demo["growth"])
-    checker.check_range_activation(demo["activation"])
-    checker.check_continuity(demo["monthly_usage"])
-    checker.check_statistical_anomaly(demo["monthly_usage"])
-    checker.check_trend_breaks(demo["monthly_usage"])
-    checker.check_cross_kpi_consistency(demo["share"], demo["growth"])
+    # ── 10종 검증 병렬 실행 ──
+    # 결과 객체가 한꺼번에 수만 개 생성되는 구간이므로 young 세대 임계값을
+    # 올려 반복적인 GC 트리거를 피하고, 종료 후 원래 값으로 복원
+    gc_defaults = gc.get_threshold()
+    gc.set_threshold(100_000, 10, 10)
+    try:
+        checker.run_all(demo)
+    finally:
+        gc.set_threshold(*gc_defaults)
 
     # ── 리포트 출력 ──
     checker.print_report()
 
-    if args.export in ("csv", "all"):
-        checker.export_to_csv(args.output)
-    if args.export in ("json", "all"):
-        checker.export_to_json(args.output)
-    if args.export in ("html", "all"):
-        checker.export_to_html(args.output)
+    # 분기 3회 대신 형식 → 메서드 디스패치 테이블에서 대상만 선택
+    export_fns = {
+        "csv": checker.export_to_csv,
+        "json": checker.export_to_json,
+        "html": checker.export_to_html,
+    }
+    targets = list(export_fns) if args.export == "all" else [args.export]
+
+    # 디렉토리 생성은 한 번만, 파일 기록은 스레드로 병렬화 —
+    # write() 시스템콜 구간은 GIL을 해제하므로 세 스트림이 겹침
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        list(executor.map(lambda fmt: export_fns[fmt](args.output), targets))
 
     # 종료 코드: CRITICAL 실패 시 1 반환 (CI/CD 연동)
     summary = checker.get_summary()
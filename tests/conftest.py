@@ -0,0 +1,38 @@
+"""
+pytest 공통 설정
+============================================================
+scripts 경로 등록과 공유 픽스처 — 세션당 한 번만 수행
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 → scripts 경로 추가 (테스트 파일이 아닌 여기서 한 번)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from run_integrity_checks import (  # noqa: E402
+    MetricsIntegrityChecker,
+    generate_demo_data,
+)
+
+
+@pytest.fixture(scope="module")
+def _module_checker() -> MetricsIntegrityChecker:
+    """모듈당 한 번만 생성되는 검증기 — 설정 로드·임계값 캐시 워밍 공유"""
+    return MetricsIntegrityChecker()
+
+
+@pytest.fixture
+def checker(_module_checker) -> MetricsIntegrityChecker:
+    yield _module_checker
+    _module_checker.reset()  # 다음 테스트를 위해 결과만 비움
+
+
+@pytest.fixture(scope="session")
+def demo_data():
+    """시드 고정 데모 데이터 — 모든 테스트가 읽기만 하므로 세션 전체 재사용"""
+    return generate_demo_data()
@@ -2,70 +2,80 @@
 지표 정합성 검증기 단위 테스트
 ============================================================
 pytest tests/test_integrity_checks.py -v
+
+픽스처가 세션 스코프 불변 데이터뿐이라 클래스 단위 병렬 실행이 안전:
+pytest tests/ -n auto --dist=loadscope  (pytest-xdist)
 """
 
 from __future__ import annotations
 
+import functools
 import json
-import os
-import tempfile
+import mmap
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-# 프로젝트 루트 → scripts 경로 추가
-import sys
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+try:  # 선택 의존성 — 본체 export_to_json과 동일한 폴백 구조
+    import orjson
+except ImportError:
+    orjson = None
 
+# scripts 경로 등록은 conftest.py가 세션 시작 시 수행
 from run_integrity_checks import (
-    CheckStatus,
-    ConfigValidationError,
     IntegrityCheckResult,
-    MetricsIntegrityChecker,
-    Severity,
     calc_iqr_bounds,
     calc_z_score,
     detect_trend_break,
-    generate_demo_data,
     load_config,
     validate_config_schema,
 )
 
 
+def first_failure(results):
+    """첫 실패 결과(없으면 None) — 실패 시 detail을 단언 메시지로 활용"""
+    return next((r for r in results if not r.is_passed), None)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str) -> dict:
+    """같은 YAML을 테스트마다 디스크에서 다시 파싱하지 않도록 메모이즈"""
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
 # ══════════════════════════════════════════════════════════
-# Fixture
+# Fixture — checker/demo_data는 conftest.py에서 공유
 # ══════════════════════════════════════════════════════════
 
 
-@pytest.fixture
-def checker() -> MetricsIntegrityChecker:
-    return MetricsIntegrityChecker()
-
+# 검증기는 입력을 변경하지 않으므로 테스트마다 재할당하지 않는 모듈 상수
+_PERFECT_SHARE_DATA = (
+    {"year_month": "2025-12-01", "card_company": "A", "market_share_pct": 40.0, "share_change_pp": 0.5},
+    {"year_month": "2025-12-01", "card_company": "B", "market_share_pct": 35.0, "share_change_pp": -0.3},
+    {"year_month": "2025-12-01", "card_company": "C", "market_share_pct": 25.0, "share_change_pp": -0.2},
+)
 
-@pytest.fixture
-def demo_data():
-    return generate_demo_data()
+_BROKEN_SHARE_DATA = (
+    {"year_month": "2025-12-01", "card_company": "A", "market_share_pct": 40.0},
+    {"year_month": "2025-12-01", "card_company": "B", "market_share_pct": 35.0},
+    {"year_month": "2025-12-01", "card_company": "C", "market_share_pct": 20.0},  # 합계 95%
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def perfect_share_data():
     """점유율 합계가 정확히 100%인 데이터"""
-    return [
-        {"year_month": "2025-12-01", "card_company": "A", "market_share_pct": 40.0, "share_change_pp": 0.5},
-        {"year_month": "2025-12-01", "card_company": "B", "market_share_pct": 35.0, "share_change_pp": -0.3},
-        {"year_month": "2025-12-01", "card_company": "C", "market_share_pct": 25.0, "share_change_pp": -0.2},
-    ]
+    return _PERFECT_SHARE_DATA
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def broken_share_data():
     """점유율 합계가 100%가 아닌 데이터"""
-    return [
-        {"year_month": "2025-12-01", "card_company": "A", "market_share_pct": 40.0},
-        {"year_month": "2025-12-01", "card_company": "B", "market_share_pct": 35.0},
-        {"year_month": "2025-12-01", "card_company": "C", "market_share_pct": 20.0},  # 합계 95%
-    ]
+    return _BROKEN_SHARE_DATA
 
 
 # ══════════════════════════════════════════════════════════
@@ -171,12 +181,9 @@ class TestConfigSchemaValidation:
 
     def test_actual_yaml_file_passes(self):
         """실제 thresholds.yaml 파일 스키마 검증 통과"""
-        import yaml
-
         config_path = Path(__file__).resolve().parent.parent / "config" / "thresholds.yaml"
         if config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+            config = _load_yaml_cached(str(config_path))
             errors = validate_config_schema(config)
             assert errors == [], f"실제 YAML 스키마 오류: {errors}"
 
@@ -263,12 +270,14 @@ class TestSumIntegrity:
             {"year_month": "2025-12", "card_company": "B", "usage_amount": 2000},
         ]
         results = checker.check_sum_integrity(data)
-        assert all(r.is_passed for r in results)
+        failure = first_failure(results)
+        assert failure is None, failure.detail
 
     def test_consistent_with_demo_data(self, checker, demo_data):
         results = checker.check_sum_integrity(demo_data["usage"])
         assert len(results) > 0
-        assert all(r.is_passed for r in results)
+        failure = first_failure(results)
+        assert failure is None, failure.detail
 
 
 # ══════════════════════════════════════════════════════════
@@ -340,26 +349,20 @@ class TestFormulaIntegrity:
 
 
 class TestRangeIntegrity:
-    def test_activation_in_range(self, checker):
+    @pytest.mark.parametrize(
+        "rate,expected",
+        [
+            (72.5, True),    # 정상 범위
+            (105.0, False),  # 상한 초과
+            (-5.0, False),   # 음수
+        ],
+    )
+    def test_activation_range(self, checker, rate, expected):
         data = [
-            {"year_month": "2025-12", "card_company": "A", "activation_rate": 72.5},
+            {"year_month": "2025-12", "card_company": "A", "activation_rate": rate},
         ]
         results = checker.check_range_activation(data)
-        assert results[0].is_passed
-
-    def test_activation_out_of_range(self, checker):
-        data = [
-            {"year_month": "2025-12", "card_company": "A", "activation_rate": 105.0},
-        ]
-        results = checker.check_range_activation(data)
-        assert not results[0].is_passed
-
-    def test_activation_negative(self, checker):
-        data = [
-            {"year_month": "2025-12", "card_company": "A", "activation_rate": -5.0},
-        ]
-        results = checker.check_range_activation(data)
-        assert not results[0].is_passed
+        assert results[0].is_passed is expected
 
 
 # ══════════════════════════════════════════════════════════
@@ -375,7 +378,8 @@ class TestContinuityIntegrity:
             {"year_month": "2025-03-01", "card_company": "A", "total_usage_amount": 120},
         ]
         results = checker.check_continuity(data)
-        assert all(r.is_passed for r in results)
+        failure = first_failure(results)
+        assert failure is None, failure.detail
 
     def test_missing_month(self, checker):
         data = [
@@ -384,7 +388,7 @@ class TestContinuityIntegrity:
             # 2025-02 누락
         ]
         results = checker.check_continuity(data)
-        assert any(not r.is_passed for r in results)
+        assert first_failure(results) is not None
 
 
 # ══════════════════════════════════════════════════════════
@@ -394,9 +398,12 @@ class TestContinuityIntegrity:
 
 class TestStatisticalIntegrity:
     def test_no_anomaly(self, checker):
+        # 수치 열은 배열 연산으로 일괄 생성 — 본체 코드와 같은 SoA 우선 패턴
+        months = np.arange(1, 13)
+        amounts = 100 + months
         data = [
-            {"year_month": f"2025-{m:02d}-01", "card_company": "A", "total_usage_amount": 100 + m}
-            for m in range(1, 13)
+            {"year_month": f"2025-{m:02d}-01", "card_company": "A", "total_usage_amount": int(a)}
+            for m, a in zip(months, amounts)
         ]
         results = checker.check_statistical_anomaly(data)
         # Z-score 이상치 비율이 5% 미만이어야 함
@@ -419,13 +426,14 @@ class TestCrossKPIIntegrity:
         share = [{"year_month": "2025-12", "card_company": "A", "share_change_pp": 1.0}]
         growth = [{"year_month": "2025-12", "card_company": "A", "mom_growth_rate": 5.0}]
         results = checker.check_cross_kpi_consistency(share, growth)
-        assert all(r.is_passed for r in results)
+        failure = first_failure(results)
+        assert failure is None, failure.detail
 
     def test_inconsistent_direction(self, checker):
         share = [{"year_month": "2025-12", "card_company": "A", "share_change_pp": 2.0}]
         growth = [{"year_month": "2025-12", "card_company": "A", "mom_growth_rate": -5.0}]
         results = checker.check_cross_kpi_consistency(share, growth)
-        assert any(not r.is_passed for r in results)
+        assert first_failure(results) is not None
 
 
 # ══════════════════════════════════════════════════════════
@@ -434,31 +442,24 @@ class TestCrossKPIIntegrity:
 
 
 class TestExport:
-    def test_csv_export(self, checker, demo_data):
+    @pytest.mark.parametrize("fmt", ["csv", "json", "html"])
+    def test_export(self, checker, demo_data, tmp_path, fmt):
+        """형식별 내보내기 — 검증 실행은 한 번, 포맷별 확인만 분기"""
         checker.check_sum_integrity(demo_data["usage"])
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = checker.export_to_csv(tmpdir)
-            assert os.path.exists(path)
-            assert path.endswith(".csv")
+        path = getattr(checker, f"export_to_{fmt}")(str(tmp_path))
+        assert Path(path).exists()
+        assert path.endswith(f".{fmt}")
 
-    def test_json_export(self, checker, demo_data):
-        checker.check_sum_integrity(demo_data["usage"])
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = checker.export_to_json(tmpdir)
-            assert os.path.exists(path)
-            with open(path, "r") as f:
-                data = json.load(f)
+        if fmt == "json":
+            raw = Path(path).read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             assert "total_checks" in data
             assert "all_checks" in data
-
-    def test_html_export(self, checker, demo_data):
-        checker.check_sum_integrity(demo_data["usage"])
-        checker.check_market_share_integrity(demo_data["share"])
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = checker.export_to_html(tmpdir)
-            assert os.path.exists(path)
-            content = open(path, "r").read()
-            assert "정합성 검증 리포트" in content
+        elif fmt == "html":
+            # 전체 str 생성·디코딩 없이 mmap 바이트 검색으로 제목만 확인
+            needle = "정합성 검증 리포트".encode("utf-8")
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                assert mm.find(needle) != -1
 
 
 # ══════════════════════════════════════════════════════════
@@ -467,18 +468,24 @@ class TestExport:
 
 
 class TestIntegration:
+    # (메서드명, 입력 키) 테이블 — 검증 추가 시 행 하나만 늘리면 됨
+    PIPELINE_STEPS = (
+        ("check_sum_integrity", ("usage",)),
+        ("check_market_share_integrity", ("share",)),
+        ("check_category_ratio_integrity", ("category",)),
+        ("check_formula_mom", ("growth",)),
+        ("check_formula_yoy", ("growth",)),
+        ("check_range_activation", ("activation",)),
+        ("check_continuity", ("monthly_usage",)),
+        ("check_statistical_anomaly", ("monthly_usage",)),
+        ("check_trend_breaks", ("monthly_usage",)),
+        ("check_cross_kpi_consistency", ("share", "growth")),
+    )
+
     def test_full_pipeline(self, checker, demo_data):
         """10종 검증 전체 파이프라인 실행"""
-        checker.check_sum_integrity(demo_data["usage"])
-        checker.check_market_share_integrity(demo_data["share"])
-        checker.check_category_ratio_integrity(demo_data["category"])
-        checker.check_formula_mom(demo_data["growth"])
-        checker.check_formula_yoy(demo_data["growth"])
-        checker.check_range_activation(demo_data["activation"])
-        checker.check_continuity(demo_data["monthly_usage"])
-        checker.check_statistical_anomaly(demo_data["monthly_usage"])
-        checker.check_trend_breaks(demo_data["monthly_usage"])
-        checker.check_cross_kpi_consistency(demo_data["share"], demo_data["growth"])
+        for name, keys in self.PIPELINE_STEPS:
+            getattr(checker, name)(*(demo_data[k] for k in keys))
 
         summary = checker.get_summary()
 